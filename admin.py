@@ -1,8 +1,35 @@
+import argparse
+import os
+import sys
+import time
+
+from movie_index import LoadedMovies
+from movie_store import MovieStore
+
+# starting catalogue for a new database
 x=[ { "name": "Forrest Gump", "year": 1994, "duration": 142, "genres": ["Drama", "Romance"] },
 { "name": "Avengers: Endgame", "year": 2019, "duration": 181, "genres": ["Action",
 "Adventure", "Drama"] }, { "name": "Back to the Future", "year": 1985, "duration": 114,
 "genres": ["Adventure", "Comedy", "Sci-Fi"] } ]
 
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "movies.db")
+
+# the catalogue lives in SQLite (movies.db next to this file, or $MOVIES_DB);
+# movies keeps it in memory by id (ids never change or get reused) and builds
+# the name/genre/year search index the first time something is searched;
+# add_movie() and delete_movie() keep both in step with the store
+class Catalogue:
+
+    def __init__(self, store):
+        self.store = store
+        self.movies = LoadedMovies(store.load())
+
+def open_catalogue(path=None):
+    store = MovieStore(path or os.environ.get("MOVIES_DB", DEFAULT_DB))
+    if store.count() == 0:
+        store.import_movies(x)
+    return Catalogue(store)
+
 def input_int(prompt):
     while True:
         try:
@@ -18,84 +45,182 @@ def input_something(prompt):
         else:
             print("Input cannot be empty. Please try again.")
 
-def add():
+def add(catalogue):
     name = input_something("Enter movie name: ")
     year = input_int("Enter release year: ")
     duration = input_int("Enter duration in minutes: ")
     genres = input_something("Enter genres (comma-separated): ").split(',')
-    genres = [genre for genre in genres]
-    
+    genres = [genre.strip() for genre in genres]
+
+    add_movie(catalogue, name, year, duration, genres)
+
+def add_movie(catalogue, name, year, duration, genres):
     new_movie = {
         "name": name,
         "year": year,
         "duration": duration,
         "genres": genres
     }
-    
-    x.append(new_movie)
 
-def list():
-    if not x:
+    new_movie["id"] = catalogue.store.add(new_movie)
+    catalogue.movies.add(new_movie)
+    return new_movie
+
+def list(catalogue):
+    if not catalogue.movies:
         print("No movies available.")
         return
-    
-    for i, movie in enumerate(x, start=1):
-        print(str(i)+ ")", movie["name"],"("+str(movie["year"])+")",str(movie["duration"])+"mins",str(movie["genres"]))
 
-def search():
+    for movie in catalogue.movies.values():
+        print(str(movie["id"])+ ")", movie["name"],"("+str(movie["year"])+")",str(movie["duration"])+"mins",str(movie["genres"]))
+
+def search(catalogue):
     search_term = input_something("Enter movie name to search: ").lower()
-    found_movies = [movie for movie in x if search_term in movie["name"].lower()]
-    
+    found_movies = catalogue.movies.search(text=search_term)
+
     if not found_movies:
         print("No movies found.")
         return
-    
-    for i, movie in enumerate(found_movies, start=1):
-        print(str(i) +")", movie["name"],"(" +str(movie["year"])+")",str(movie["duration"]),"mins",str(movie["genres"]))
-
-def view():
-    index=input_int("Enter movie index to view details : ")
-    if index < 1 or index > len(x):
-        print("Invalid index. Please try again.")
+
+    for movie in found_movies:
+        show(movie)
+
+def view(catalogue):
+    index=input_int("Enter movie id to view details : ")
+    if index not in catalogue.movies:
+        print("Invalid id. Please try again.")
         return
     else:
-        movie=x[index-1]
-        print(str(index)+")", movie["name"],"(" +str(movie["year"])+")",str(movie["duration"]),"mins",str(movie["genres"]))
-
-def delete():
-    index=input_int("Enter movie index to delete: ")
-    if index<1 or index >len(x):
-        print("Index out of range. Please try again.")
-    elif not x:
-            print("No movies available.")
+        show(catalogue.movies[index])
+
+def delete(catalogue):
+    index=input_int("Enter movie id to delete: ")
+    if not catalogue.movies:
+        print("No movies available.")
+    elif index not in catalogue.movies:
+        print("No movie with that id. Please try again.")
     else:
-        x.pop(index-1)
-        print("Movie at index",index,"deleted successfully")
+        delete_movie(catalogue, index)
+        print("Movie",index,"deleted successfully")
+
+def delete_movie(catalogue, movie_id):
+    catalogue.store.delete(movie_id)
+    catalogue.movies.pop(movie_id)
+
+def show(movie):
+    print(str(movie["id"])+")", movie["name"],"(" +str(movie["year"])+")",str(movie["duration"]),"mins",str(movie["genres"]))
 
 
-print("Choose \n[a]dd\n[l]ist\n[s]earch \n[v]iew\n[d]elete\n[q]uit.")
-print("List of movies: ")
-list()
-choice=input("Choose an action: ")
-while choice!='q':
-    if choice=='a':
-        add()
-        print("New list: ")
-        list()
-    elif choice=='l':
-        list()
-    elif choice=='s':
-        search()
-    elif choice=='v':
-        view()
-    elif choice=='d':
-        delete()
-        print("New list: ")
-        list()
-    choice=input("\nChoose an action again: ")
+# --- batch mode ---
+# One command per line; blank lines and lines starting with # are skipped:
+#   add Name | year | duration | genre, genre
+#   delete 12      view 12      search term      list
+# The first letter alone (a/d/v/s/l) also works, as in the interactive menu.
+COMMANDS = {"add": "a", "delete": "d", "view": "v", "search": "s", "list": "l"}
+COMMANDS.update({letter: letter for letter in COMMANDS.values()})
+
+def run_batch(catalogue, lines, verbose=False):
+    counts = {"added": 0, "deleted": 0, "viewed": 0, "searches": 0, "matches": 0, "lists": 0, "errors": 0}
+
+    def error(lineno, message):
+        counts["errors"] += 1
+        print("line", lineno, ":", message, file=sys.stderr)
+
+    # every add and delete in the script is one SQLite transaction
+    with catalogue.store.transaction():
+        for lineno, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            word, _, arg = line.partition(" ")
+            command, arg = COMMANDS.get(word.lower()), arg.strip()
+            if command == "a":
+                fields = [field.strip() for field in arg.split("|")]
+                if len(fields) != 4 or not fields[0] or not fields[1].isdigit() or not fields[2].isdigit():
+                    error(lineno, "expected: add name | year | duration | genres")
+                    continue
+                movie = add_movie(catalogue, fields[0], int(fields[1]), int(fields[2]),
+                                  [genre.strip() for genre in fields[3].split(",") if genre.strip()])
+                counts["added"] += 1
+                if verbose:
+                    show(movie)
+            elif command in ("d", "v"):
+                if not arg.isdigit() or int(arg) not in catalogue.movies:
+                    error(lineno, "no movie with id " + arg)
+                elif command == "d":
+                    delete_movie(catalogue, int(arg))
+                    counts["deleted"] += 1
+                else:
+                    counts["viewed"] += 1
+                    if verbose:
+                        show(catalogue.movies[int(arg)])
+            elif command == "s":
+                if not arg:
+                    error(lineno, "expected: search term")
+                    continue
+                found_movies = catalogue.movies.search(text=arg)
+                counts["searches"] += 1
+                counts["matches"] += len(found_movies)
+                if verbose:
+                    for movie in found_movies:
+                        show(movie)
+            elif command == "l":
+                counts["lists"] += 1
+                if verbose:
+                    list(catalogue)
+            else:
+                error(lineno, "unknown command " + repr(word))
+    return counts
+
+def batch(path, verbose=False):
+    catalogue = open_catalogue()
+    t = time.perf_counter()
+    try:
+        if path == "-":
+            counts = run_batch(catalogue, sys.stdin, verbose)
+        else:
+            with open(path) as f:
+                counts = run_batch(catalogue, f, verbose)
+    finally:
+        catalogue.store.close()
+    print(", ".join(name + " " + str(count) for name, count in counts.items()),
+          "in", round(time.perf_counter() - t, 2), "s;", len(catalogue.movies), "movies now")
+    return counts
 
-print("Goodbye!")
+def main():
+    catalogue = open_catalogue()
+    print("Choose \n[a]dd\n[l]ist\n[s]earch \n[v]iew\n[d]elete\n[q]uit.")
+    print("List of movies: ")
+    list(catalogue)
+    choice=input("Choose an action: ")
+    while choice!='q':
+        if choice=='a':
+            add(catalogue)
+            print("New list: ")
+            list(catalogue)
+        elif choice=='l':
+            list(catalogue)
+        elif choice=='s':
+            search(catalogue)
+        elif choice=='v':
+            view(catalogue)
+        elif choice=='d':
+            delete(catalogue)
+            print("New list: ")
+            list(catalogue)
+        choice=input("\nChoose an action again: ")
 
+    catalogue.store.close()
+    print("Goodbye!")
 
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Movie catalogue admin.")
+    parser.add_argument("--batch", metavar="FILE", help="run commands from FILE ('-' for stdin) instead of the menu")
+    parser.add_argument("--verbose", action="store_true", help="in batch mode, print what each command shows")
+    args = parser.parse_args()
 
+    if args.batch:
+        counts = batch(args.batch, args.verbose)
+        sys.exit(1 if counts["errors"] else 0)
+    main()
@@ -0,0 +1,121 @@
+"""Extract email addresses from large text files.
+
+Uses regex1.ipynb's pattern `patt`, compiled once per process and run
+over a memory-mapped file rather than an input() string, starting only
+at the "@"s that find() locates (see find_emails).  The file is
+cut into newline-aligned ranges that worker processes scan in parallel;
+matches are deduplicated as they stream back and are written out
+straight away, in file order, instead of being collected into a list.
+
+    python email_extract.py crm_export.csv logs/*.log -o emails.txt --jobs 4
+"""
+import argparse
+import contextlib
+import mmap
+import multiprocessing
+import os
+import re
+import sys
+import time
+
+PATTERN = "[a-zA-Z0-9._]+@[a-z]+.[a-z]{2,6}"
+# The same pattern for UTF-8 bytes: its unescaped "." matches one
+# character (not a newline), which may take several bytes.
+UTF8_CHAR = rb"(?:[\x00-\x09\x0b-\x7f]|[\xc0-\xff][\x80-\xbf]*)"
+BYTES_PATTERN = re.compile(PATTERN.encode().replace(b".[a-z]{2,6}", UTF8_CHAR + b"[a-z]{2,6}"))
+LOCAL_PART = frozenset(b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._")
+
+
+def chunk_bounds(mm, chunk_bytes):
+    """Byte ranges covering mm, each ending just after a newline (or at the end)."""
+    bounds, start, size = [], 0, len(mm)
+    while start < size:
+        end = mm.find(b"\n", min(start + chunk_bytes, size))
+        end = size if end == -1 else end + 1
+        bounds.append((start, end))
+        start = end
+    return bounds
+
+
+def find_emails(mm, pos, end):
+    """The matches of BYTES_PATTERN.finditer(mm, pos, end), found faster.
+
+    Every match contains an "@", so jump between them with find() (a
+    memchr) and only try the pattern from the start of the run of
+    local-part characters just before each one.  If it fails there it
+    fails from every later start in that run too, as they all need this
+    same "@".
+    """
+    find, match = mm.find, BYTES_PATTERN.match
+    while True:
+        at = find(b"@", pos, end)
+        if at == -1:
+            return
+        start = at
+        while start > pos and mm[start - 1] in LOCAL_PART:
+            start -= 1
+        found = match(mm, start, end) if start < at else None
+        if found:
+            yield found
+            pos = found.end()
+        else:
+            pos = at + 1
+
+
+def scan_range(task):
+    """Matches in one byte range, in order (first appearances only if dedup)."""
+    path, start, end, dedup = task
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        found = [match.group() for match in find_emails(mm, start, end)]
+    if dedup:
+        found = dict.fromkeys(found)
+    return [email.decode("utf-8", errors="replace") for email in found]
+
+
+def extract(paths, jobs=None, chunk_bytes=32 << 20, dedup=True):
+    """Yield the emails in paths, file by file and in order, each once if dedup."""
+    tasks = []
+    for path in paths:
+        if os.path.getsize(path) == 0:
+            continue
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            tasks.extend((path, start, end, dedup) for start, end in chunk_bounds(mm, chunk_bytes))
+    jobs = min(jobs or os.cpu_count() or 1, max(len(tasks), 1))
+    seen = set()
+    with multiprocessing.Pool(jobs) if jobs > 1 else contextlib.nullcontext() as pool:
+        results = pool.imap(scan_range, tasks) if pool else map(scan_range, tasks)
+        for emails in results:
+            for email in emails:
+                if not dedup:
+                    yield email
+                elif email not in seen:
+                    seen.add(email)
+                    yield email
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract email addresses from text files.")
+    parser.add_argument("paths", nargs="+", help="files to scan")
+    parser.add_argument("-o", "--output", help="write emails here instead of stdout")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-mb", type=float, default=32, help="MB of a file per task")
+    parser.add_argument("--all", action="store_true", help="write every match, repeats included")
+    args = parser.parse_args()
+    for path in args.paths:
+        if not os.path.isfile(path):
+            parser.error("no such file: " + path)
+
+    t = time.perf_counter()
+    size = sum(os.path.getsize(path) for path in args.paths)
+    out = open(args.output, "w") if args.output else sys.stdout
+    count = 0
+    try:
+        for email in extract(args.paths, args.jobs, int(args.chunk_mb * (1 << 20)), dedup=not args.all):
+            out.write(email + "\n")
+            count += 1
+    finally:
+        if args.output:
+            out.close()
+    seconds = time.perf_counter() - t
+    print("%d emails from %.1f MB in %.2f s (%.1f MB/s)" % (count, size / 1e6, seconds, size / 1e6 / seconds),
+          file=sys.stderr)
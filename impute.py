@@ -0,0 +1,103 @@
+"""Fill missing values from group statistics, e.g. ages by passenger title.
+
+agecalculation.ipynb walks tested.csv once per title with iterrows() and
+substring tests, so 'Mr' also picks up every 'Mrs', and then fills each
+group with its own .loc pass.  Here the title is pulled out of
+"Surname, Title. Given names" once with a vectorized str.extract, and all
+the requested columns are filled in one groupby(...).transform.
+
+    python impute.py              # tested.csv, then a 1,000,000-row benchmark
+    python impute.py 5000000
+"""
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+TITLE_PATTERN = r",\s*([^.,]+?)\s*\."
+# The notebook counts Ms together with Miss.
+TITLE_ALIASES = {"Ms": "Miss"}
+
+
+def extract_titles(names, aliases=TITLE_ALIASES):
+    """The title of each "Surname, Title. Given names" name (NaN if none)."""
+    titles = names.str.extract(TITLE_PATTERN, expand=False)
+    return titles.replace(aliases) if aliases else titles
+
+
+def fill_by_group(df, columns, by, how="mean"):
+    """Copy of df with NaNs in columns replaced by their group's statistic.
+
+    by is anything DataFrame.groupby accepts (column names or arrays);
+    how is an aggregation name such as "mean" or "median".  Groups with no
+    values at all, and rows whose key is NaN, stay missing.
+    """
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    df = df.copy()
+    df[columns] = df[columns].fillna(df.groupby(by)[columns].transform(how))
+    return df
+
+
+def impute_ages(df, name="Name", age="Age", title="Title", how="mean"):
+    """Add a title column taken from the names and fill missing ages by title."""
+    df = df.assign(**{title: extract_titles(df[name])})
+    return fill_by_group(df, age, title, how)
+
+
+# --- Benchmark ---
+def notebook_impute(data):
+    # agecalculation.ipynb, unchanged apart from returning the frame
+    data = data.copy()
+    master_ind = [i[0] for i in data.iterrows() if 'Master' in i[1]['Name']]
+    mister_ind = [i[0] for i in data.iterrows() if 'Mr' in i[1]['Name']]
+    ms_ind = [i[0] for i in data.iterrows() if 'Miss' in i[1]['Name'] or 'Ms' in i[1]['Name']]
+    mrs_ind = [i[0] for i in data.iterrows() if 'Mrs' in i[1]['Name']]
+    for ind in (master_ind, mister_ind, ms_ind, mrs_ind):
+        group = data.loc[ind, ['Age']]
+        data.loc[ind, 'Age'] = group['Age'].fillna(group['Age'].mean())
+    return data
+
+
+def synthetic_passengers(n, seed=0):
+    rng = np.random.default_rng(seed)
+    titles = np.array(["Mr", "Mrs", "Miss", "Master", "Ms", "Dr", "Rev"])
+    title = titles[rng.choice(len(titles), n, p=[0.55, 0.15, 0.18, 0.07, 0.01, 0.02, 0.02])]
+    surnames = np.array(["Kelly", "Wilkes", "Myles", "Wirz", "Hirvonen", "Svensson", "Connolly", "Caldwell"])
+    names = pd.Series(surnames[rng.integers(0, len(surnames), n)]).str.cat(
+        pd.Series(title), sep=", ").str.cat(pd.Series(["James", "Ellen", "Thomas", "Albert"])[
+            rng.integers(0, 4, n)].to_numpy(), sep=". ")
+    mean_age = pd.Series(title).map({"Mr": 32, "Mrs": 38, "Miss": 22, "Ms": 28, "Master": 7, "Dr": 45, "Rev": 40})
+    age = np.clip(rng.normal(mean_age, 8), 0.2, 80).round(1)
+    age[rng.random(n) < 0.2] = np.nan
+    return pd.DataFrame({"PassengerId": np.arange(n), "Name": names, "Age": age,
+                         "Fare": rng.gamma(2, 15, n).round(2)})
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t
+
+
+if __name__ == "__main__":
+    data = pd.read_csv(os.path.join(HERE, "tested.csv"))
+    filled = impute_ages(data)
+    old = notebook_impute(data)
+    changed = filled["Age"].ne(old["Age"]) & data["Age"].isna()
+    print("tested.csv:", int(data["Age"].isna().sum()), "missing ages,", int(filled["Age"].isna().sum()), "left;",
+          int(changed.sum()), "filled differently from the notebook, by title:",
+          filled.loc[changed, "Title"].value_counts().to_dict())
+
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 1000000
+    passengers = synthetic_passengers(n)
+    print("\n%d synthetic passengers, %d missing ages" % (n, passengers["Age"].isna().sum()))
+    titles, extract = timed(extract_titles, passengers["Name"])
+    _, fill = timed(fill_by_group, passengers.assign(Title=titles), ["Age", "Fare"], "Title")
+    sample = passengers.head(20000)
+    _, loop = timed(notebook_impute, sample)
+    print("str.extract titles  : %.2f s" % extract)
+    print("groupby transform   : %.2f s (Age and Fare)" % fill)
+    print("notebook iterrows   : ~%.0f s (timed on %d rows, scaled)" % (loop * n / len(sample), len(sample)))
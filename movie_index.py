@@ -0,0 +1,230 @@
+"""In-memory indexes for the admin.py movie catalogue.
+
+MovieIndex keeps three inverted indexes over the movie dicts:
+
+* every trigram of the lower-cased name -> movies whose name contains it,
+  so a substring search only checks the movies sharing all the query's
+  trigrams instead of every title;
+* genre (case-insensitive) -> movies;
+* year -> movies, with a sorted list of the distinct years for ranges.
+
+Movies are tracked by object identity, so the catalogue list can keep
+using plain dicts; add() and remove() keep all indexes in step.
+
+LoadedMovies holds a loaded catalogue as {id: movie} and only builds its
+MovieIndex on the first search, so commands that never search do not
+pay for indexing the whole table.
+
+    python movie_index.py 1000000     # benchmark against a linear scan
+"""
+import bisect
+import random
+import sys
+import time
+
+# Below this many candidates, names are checked directly instead of
+# intersecting more trigram postings.
+CHECK_DIRECTLY = 256
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def genre_key(genre):
+    return genre.strip().lower()
+
+
+class MovieIndex:
+
+    def __init__(self, movies=()):
+        self.movies = {}      # id(movie) -> movie
+        self.order = {}       # id(movie) -> insertion number, to return results in catalogue order
+        self.names = {}       # id(movie) -> lower-cased name
+        self.short = set()    # ids of names too short to have a trigram
+        self.by_trigram = {}
+        self.by_genre = {}
+        self.by_year = {}
+        self.years = []       # sorted distinct years
+        self.counter = 0
+        for movie in movies:
+            self.add(movie)
+
+    def __len__(self):
+        return len(self.movies)
+
+    def add(self, movie):
+        key = id(movie)
+        name = movie["name"].lower()
+        self.movies[key] = movie
+        self.order[key] = self.counter
+        self.counter += 1
+        self.names[key] = name
+        if len(name) < 3:
+            self.short.add(key)
+        for gram in trigrams(name):
+            self.by_trigram.setdefault(gram, set()).add(key)
+        for genre in movie["genres"]:
+            self.by_genre.setdefault(genre_key(genre), set()).add(key)
+        if movie["year"] not in self.by_year:
+            self.by_year[movie["year"]] = set()
+            bisect.insort(self.years, movie["year"])
+        self.by_year[movie["year"]].add(key)
+
+    def remove(self, movie):
+        key = id(movie)
+        if key not in self.movies:
+            return
+        name = self.names.pop(key)
+        del self.movies[key], self.order[key]
+        self.short.discard(key)
+        for gram in trigrams(name):
+            self._discard(self.by_trigram, gram, key)
+        for genre in movie["genres"]:
+            self._discard(self.by_genre, genre_key(genre), key)
+        if self._discard(self.by_year, movie["year"], key):
+            del self.years[bisect.bisect_left(self.years, movie["year"])]
+
+    @staticmethod
+    def _discard(index, value, key):
+        """Remove key from index[value]; True if that emptied and dropped it."""
+        keys = index.get(value)
+        if keys is None:
+            return False
+        keys.discard(key)
+        if not keys:
+            del index[value]
+            return True
+        return False
+
+    def _name_candidates(self, text, keys=None):
+        """Keys that may contain text, narrowed down from keys (None = all)."""
+        grams = trigrams(text)
+        if grams:
+            # Intersect the smallest postings first, and stop once few enough
+            # candidates are left that checking their names is cheaper.
+            for posting in sorted((self.by_trigram.get(gram, set()) for gram in grams), key=len):
+                if keys is not None and len(keys) <= CHECK_DIRECTLY:
+                    break
+                keys = set(posting) if keys is None else keys & posting
+            return keys
+        # Queries shorter than a trigram: every trigram containing them.
+        found = set()
+        for gram, posting in self.by_trigram.items():
+            if text in gram:
+                found |= posting
+        # Names too short to have any trigram are only in self.short.
+        found.update(key for key in self.short if text in self.names[key])
+        return found if keys is None else keys & found
+
+    def _year_candidates(self, year_from, year_to):
+        lo = 0 if year_from is None else bisect.bisect_left(self.years, year_from)
+        hi = len(self.years) if year_to is None else bisect.bisect_right(self.years, year_to)
+        found = set()
+        for year in self.years[lo:hi]:
+            found |= self.by_year[year]
+        return found
+
+    def search(self, text=None, genre=None, year_from=None, year_to=None):
+        """Movies matching every given filter, in the order they were added.
+
+        text is a case-insensitive substring of the name, genre an exact
+        (case-insensitive) genre and year_from/year_to an inclusive range.
+        """
+        filters = []
+        if genre is not None:
+            filters.append(self.by_genre.get(genre_key(genre), set()))
+        if year_from is not None or year_to is not None:
+            filters.append(self._year_candidates(year_from, year_to))
+        keys = None
+        if filters:
+            filters.sort(key=len)
+            keys = set.intersection(*filters) if filters[0] else set()
+        if text:
+            text = text.lower()
+            keys = [key for key in self._name_candidates(text, keys) if text in self.names[key]]
+        elif keys is None:
+            keys = self.movies.keys()
+        return [self.movies[key] for key in sorted(keys, key=self.order.__getitem__)]
+
+
+class LoadedMovies:
+    """{id: movie} for a loaded catalogue, indexed on the first search."""
+
+    def __init__(self, movies):
+        self.by_id = movies
+        self._index = None
+
+    def __len__(self):
+        return len(self.by_id)
+
+    def __contains__(self, movie_id):
+        return movie_id in self.by_id
+
+    def __getitem__(self, movie_id):
+        return self.by_id[movie_id]
+
+    def values(self):
+        return self.by_id.values()
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = MovieIndex(self.by_id.values())
+        return self._index
+
+    def add(self, movie):
+        """Track a movie that now has an id in the store."""
+        self.by_id[movie["id"]] = movie
+        if self._index is not None:
+            self._index.add(movie)
+
+    def pop(self, movie_id):
+        """Forget a deleted movie; returns it, or None if it was not loaded."""
+        movie = self.by_id.pop(movie_id, None)
+        if movie is not None and self._index is not None:
+            self._index.remove(movie)
+        return movie
+
+    def search(self, **filters):
+        """MovieIndex.search over the loaded movies."""
+        return self.index.search(**filters)
+
+
+def random_movies(n, seed=0):
+    rng = random.Random(seed)
+    words = ["love", "night", "star", "war", "return", "dark", "city", "king", "dream", "future",
+             "lost", "fire", "river", "ghost", "storm", "game", "heart", "shadow", "last", "road"]
+    genres = ["Drama", "Romance", "Action", "Adventure", "Comedy", "Sci-Fi", "Horror", "Thriller"]
+    return [{"name": " ".join(rng.choice(words) for _ in range(rng.randint(2, 4))).title() + " " + str(i),
+             "year": rng.randint(1920, 2025),
+             "duration": rng.randint(70, 200),
+             "genres": rng.sample(genres, rng.randint(1, 3))} for i in range(n)]
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    movies = random_movies(n)
+    t = time.perf_counter()
+    index = MovieIndex(movies)
+    print("Indexed", n, "movies in", round(time.perf_counter() - t, 2), "s")
+
+    title = movies[n // 2]["name"]
+    queries = [("title '" + title[-12:] + "'", dict(text=title[-12:])),
+               ("substring '99999'", dict(text="99999")),
+               ("genre + years + 'night king'", dict(genre="horror", year_from=1990, year_to=1991, text="night king")),
+               ("year 2001 + 'lost dream'", dict(year_from=2001, year_to=2001, text="lost dream")),
+               ("genre + years", dict(genre="sci-fi", year_from=1999, year_to=1999))]
+    for label, query in queries:
+        t = time.perf_counter()
+        found = index.search(**query)
+        indexed = time.perf_counter() - t
+        t = time.perf_counter()
+        text = (query.get("text") or "").lower()
+        scanned = [m for m in movies if text in m["name"].lower()
+                   and (query.get("genre") is None or query["genre"].lower() in [genre_key(g) for g in m["genres"]])
+                   and query.get("year_from", -1) <= m["year"] <= query.get("year_to", 10**9)]
+        scan = time.perf_counter() - t
+        assert found == scanned
+        print(label, ":", len(found), "found,", round(indexed * 1000, 3), "ms indexed vs",
+              round(scan * 1000, 1), "ms scan")
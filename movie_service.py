@@ -0,0 +1,388 @@
+"""HTTP service for the admin.py movie catalogue.
+
+A small asyncio HTTP/1.1 server (stdlib only) so several operators and
+scripts can use the catalogue at once instead of the one-user console
+loop.  SQLite calls run on a pool of worker threads, each holding its own
+MovieStore connection (WAL lets readers run while a write commits); name
+searches use the in-memory LoadedMovies index (shared with admin.py),
+which only the event loop touches.  Adds and deletes hold a lock from the
+SQLite write until the index is updated, so a DELETE cannot slip in
+between an add's commit and its indexing.
+
+    GET    /movies?after=0&limit=50     one page, in id order, plus "next"
+    GET    /movies/ID
+    POST   /movies                      {"name", "year", "duration", "genres"}
+    DELETE /movies/ID
+    GET    /search?q=&genre=&year_from=&year_to=&limit=
+
+    python movie_service.py serve --port 8000 --db movies.db
+    python movie_service.py bench --clients 50 --requests 5000
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import urllib.parse
+
+from movie_index import LoadedMovies, random_movies
+from movie_store import MovieStore, parse_genres
+
+DEFAULT_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "movies.db")
+PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+REASONS = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+           405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# --- Storage pool ---
+class StorePool:
+    """Run MovieStore calls on worker threads, one connection per thread."""
+
+    def __init__(self, path, size=4):
+        self.path = path
+        self.local = threading.local()
+        self.stores = []
+        self.executor = concurrent.futures.ThreadPoolExecutor(size, thread_name_prefix="store",
+                                                              initializer=self._connect)
+
+    def _connect(self):
+        # only this thread uses the connection; close() runs after shutdown
+        self.local.store = MovieStore(self.path, check_same_thread=False)
+        self.stores.append(self.local.store)
+
+    def _call(self, method, args):
+        return getattr(self.local.store, method)(*args)
+
+    async def run(self, method, *args):
+        """await pool.run("get", 12) -> store.get(12) on a worker thread."""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, self._call, method, args)
+
+    def close(self):
+        self.executor.shutdown()
+        for store in self.stores:
+            store.close()
+
+
+# --- Catalogue operations ---
+class Catalogue:
+
+    def __init__(self, path, pool_size=4):
+        with MovieStore(path) as store:
+            self.movies = LoadedMovies(store.load())
+        # build the index now rather than stalling the first search request
+        self.movies.index
+        self.pool = StorePool(path, pool_size)
+        self.write_lock = asyncio.Lock()
+
+    async def add(self, movie):
+        try:
+            movie = {"name": str(movie["name"]).strip(), "year": int(movie["year"]),
+                     "duration": int(movie["duration"]), "genres": parse_genres(movie["genres"])}
+        except (KeyError, TypeError, ValueError):
+            raise HTTPError(400, "expected name, year, duration and genres")
+        if not movie["name"]:
+            raise HTTPError(400, "name cannot be empty")
+        async with self.write_lock:
+            movie["id"] = await self.pool.run("add", movie)
+            self.movies.add(movie)
+        return movie
+
+    async def view(self, movie_id):
+        movie = await self.pool.run("get", movie_id)
+        if movie is None:
+            raise HTTPError(404, "no movie with id " + str(movie_id))
+        return movie
+
+    async def delete(self, movie_id):
+        async with self.write_lock:
+            if not await self.pool.run("delete", movie_id):
+                raise HTTPError(404, "no movie with id " + str(movie_id))
+            self.movies.pop(movie_id)
+
+    async def page(self, after_id, limit):
+        movies = await self.pool.run("page", after_id, limit)
+        return {"movies": movies, "next": movies[-1]["id"] if len(movies) == limit else None}
+
+    def search(self, text=None, genre=None, year_from=None, year_to=None, limit=PAGE_SIZE):
+        found = self.movies.search(text=text, genre=genre, year_from=year_from, year_to=year_to)
+        return {"count": len(found), "movies": found[:limit]}
+
+    def close(self):
+        self.pool.close()
+
+
+# --- HTTP ---
+def int_param(params, name, default=None, low=None, high=None):
+    value = params.get(name, [None])[0]
+    if value is None or value == "":
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        raise HTTPError(400, name + " must be an integer")
+    if low is not None:
+        value = max(value, low)
+    if high is not None:
+        value = min(value, high)
+    return value
+
+
+def movie_id(part):
+    if not part.isdigit():
+        raise HTTPError(404, "no movie with id " + part)
+    return int(part)
+
+
+async def route(catalogue, method, target, body):
+    """Return (status, payload) for one request."""
+    url = urllib.parse.urlsplit(target)
+    params = urllib.parse.parse_qs(url.query)
+    parts = [part for part in url.path.split("/") if part]
+    limit = int_param(params, "limit", PAGE_SIZE, 1, MAX_PAGE_SIZE)
+
+    if parts == ["movies"]:
+        if method == "GET":
+            return 200, await catalogue.page(int_param(params, "after", 0, 0), limit)
+        if method == "POST":
+            try:
+                movie = json.loads(body)
+            except ValueError:
+                raise HTTPError(400, "body must be a JSON object")
+            return 201, await catalogue.add(movie if isinstance(movie, dict) else {})
+    elif len(parts) == 2 and parts[0] == "movies":
+        if method == "GET":
+            return 200, await catalogue.view(movie_id(parts[1]))
+        if method == "DELETE":
+            await catalogue.delete(movie_id(parts[1]))
+            return 204, None
+    elif parts == ["search"]:
+        if method == "GET":
+            return 200, catalogue.search(params.get("q", [None])[0], params.get("genre", [None])[0],
+                                         int_param(params, "year_from"), int_param(params, "year_to"), limit)
+    else:
+        raise HTTPError(404, "not found")
+    raise HTTPError(405, method + " not allowed here")
+
+
+def response(status, payload, keep_alive):
+    body = b"" if payload is None else json.dumps(payload).encode()
+    head = ["HTTP/1.1 %d %s" % (status, REASONS[status]),
+            "Content-Length: %d" % len(body),
+            "Connection: " + ("keep-alive" if keep_alive else "close")]
+    if body:
+        head.append("Content-Type: application/json")
+    return ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+
+async def handle(catalogue, reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line.strip():
+                break
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            body = await reader.readexactly(int(headers.get("content-length", 0)))
+            method, target, version = request_line.decode("latin-1").split()
+            keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+            try:
+                status, payload = await route(catalogue, method, target, body)
+            except HTTPError as exc:
+                status, payload = exc.status, {"error": str(exc)}
+            except Exception:
+                # the details stay in the server's log, not in the response
+                print("error handling", method, target, file=sys.stderr)
+                traceback.print_exc()
+                status, payload = 500, {"error": "internal server error"}
+            writer.write(response(status, payload, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(args):
+    catalogue = Catalogue(args.db, args.pool)
+    server = await asyncio.start_server(lambda r, w: handle(catalogue, r, w), args.host, args.port)
+    print("Serving", len(catalogue.movies), "movies from", args.db, "on http://%s:%d" % (args.host, args.port),
+          flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        catalogue.close()
+
+
+# --- Benchmark ---
+class Client:
+    """One keep-alive HTTP connection."""
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def request(self, method, target, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self.writer.write(("%s %s HTTP/1.1\r\nHost: %s\r\nContent-Length: %d\r\n\r\n"
+                           % (method, target, self.host, len(body))).encode() + body)
+        await self.writer.drain()
+        status = int((await self.reader.readline()).split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readline()
+            if not line.strip():
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            if name.strip().lower() == "content-length":
+                length = int(value)
+        data = await self.reader.readexactly(length)
+        return status, json.loads(data) if data else None
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+WORDS = ["love", "night", "star", "war", "dark", "city", "king", "dream", "lost", "fire", "ghost", "storm"]
+OPERATIONS = {"search": 4, "view": 3, "list": 2, "add": 1, "delete": 1}
+
+
+async def client_loop(port, rng, ids, count, results):
+    client = Client("127.0.0.1", port)
+    try:
+        for _ in range(count):
+            op = rng.choices(list(OPERATIONS), weights=list(OPERATIONS.values()))[0]
+            if not ids and op in ("view", "list", "delete"):
+                # every movie has been deleted: add one to refill the catalogue
+                op = "add"
+            if op == "search":
+                request = ("GET", "/search?q=" + rng.choice(WORDS) + "+" + rng.choice(WORDS) + "&limit=20", None)
+            elif op == "view":
+                request = ("GET", "/movies/%d" % rng.choice(ids), None)
+            elif op == "list":
+                request = ("GET", "/movies?after=%d&limit=50" % rng.choice(ids), None)
+            elif op == "add":
+                request = ("POST", "/movies", random_movies(1, rng.random())[0])
+            else:
+                request = ("DELETE", "/movies/%d" % ids.pop(rng.randrange(len(ids))), None)
+            t = time.perf_counter()
+            status, payload = await client.request(*request)
+            results.append((op, time.perf_counter() - t, status < 400))
+            if op == "add" and status == 201:
+                ids.append(payload["id"])
+    finally:
+        client.close()
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_service(db, port, pool):
+    proc = subprocess.Popen([sys.executable, os.path.abspath(__file__), "serve", "--db", db,
+                             "--port", str(port), "--pool", str(pool)], stdout=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("movie_service exited with code %d" % proc.returncode)
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("movie_service did not start in time")
+
+
+async def bench_run(args, port, ids):
+    results = []
+    per_client = args.requests // args.clients
+    t = time.perf_counter()
+    await asyncio.gather(*(client_loop(port, random.Random(args.seed + i), ids, per_client, results)
+                           for i in range(args.clients)))
+    return results, time.perf_counter() - t
+
+
+def bench(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "bench.db")
+        with MovieStore(db) as store:
+            store.import_movies(random_movies(args.movies))
+            ids = list(store.load())
+        port = free_port()
+        proc = start_service(db, port, args.pool)
+        try:
+            results, wall = asyncio.run(bench_run(args, port, ids))
+        finally:
+            proc.terminate()
+            proc.wait()
+
+    print(args.clients, "clients,", len(results), "requests against", args.movies, "movies, pool of", args.pool)
+    print("throughput:", round(len(results) / wall), "requests/s,",
+          sum(1 for r in results if not r[2]), "errors")
+    print("  %-8s %6s %8s %8s %8s" % ("op", "count", "p50 ms", "p95 ms", "p99 ms"))
+    for op in list(OPERATIONS) + ["all"]:
+        times = [r[1] * 1000 for r in results if op in (r[0], "all")]
+        if times:
+            print("  %-8s %6d %8.2f %8.2f %8.2f" % (op, len(times), percentile(times, 50),
+                                                    percentile(times, 95), percentile(times, 99)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Movie catalogue HTTP service.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    serve_parser = commands.add_parser("serve", help="run the service")
+    serve_parser.add_argument("--db", default=os.environ.get("MOVIES_DB", DEFAULT_DB))
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--pool", type=int, default=4, help="storage worker threads")
+    bench_parser = commands.add_parser("bench", help="benchmark concurrent clients against a local instance")
+    bench_parser.add_argument("--clients", type=int, default=50)
+    bench_parser.add_argument("--requests", type=int, default=5000, help="in total, split across clients")
+    bench_parser.add_argument("--movies", type=int, default=100000, help="size of the generated catalogue")
+    bench_parser.add_argument("--pool", type=int, default=4, help="storage worker threads")
+    bench_parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args))
+        except KeyboardInterrupt:
+            pass
+    else:
+        if args.clients < 1 or args.requests < args.clients:
+            parser.error("need at least one client and one request per client")
+        bench(args)
@@ -0,0 +1,135 @@
+"""SQLite storage for the admin.py movie catalogue.
+
+Every movie gets an INTEGER PRIMARY KEY id that is never reused
+(AUTOINCREMENT), so ids stay valid across deletes and restarts; lookup
+and delete by id are B-tree operations.  Bulk imports from JSON or CSV
+run as one transaction.
+
+    python movie_store.py movies.db import catalogue.json
+    python movie_store.py movies.db count
+"""
+import contextlib
+import csv
+import json
+import os
+import sqlite3
+import sys
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS movies (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    name     TEXT NOT NULL,
+    year     INTEGER NOT NULL,
+    duration INTEGER NOT NULL,
+    genres   TEXT NOT NULL          -- JSON list
+);
+CREATE INDEX IF NOT EXISTS movies_year ON movies (year);
+"""
+
+
+def parse_genres(value):
+    if isinstance(value, str):
+        return [genre.strip() for genre in value.split(",") if genre.strip()]
+    return [genre.strip() for genre in value]
+
+
+def row_to_movie(row):
+    return {"id": row[0], "name": row[1], "year": row[2], "duration": row[3], "genres": json.loads(row[4])}
+
+
+def movie_to_row(movie):
+    return (movie["name"], int(movie["year"]), int(movie["duration"]), json.dumps(parse_genres(movie["genres"])))
+
+
+class MovieStore:
+
+    def __init__(self, path, check_same_thread=True):
+        self.path = path
+        self.db = sqlite3.connect(path, check_same_thread=check_same_thread)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.executescript(SCHEMA)
+        self.depth = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Commit everything written inside as one transaction (nestable)."""
+        self.depth += 1
+        try:
+            if self.depth == 1:
+                with self.db:
+                    yield
+            else:
+                yield
+        finally:
+            self.depth -= 1
+
+    def count(self):
+        return self.db.execute("SELECT COUNT(*) FROM movies").fetchone()[0]
+
+    def add(self, movie):
+        """Insert movie and return its new id."""
+        with self.transaction():
+            cur = self.db.execute("INSERT INTO movies (name, year, duration, genres) VALUES (?, ?, ?, ?)",
+                                  movie_to_row(movie))
+        return cur.lastrowid
+
+    def get(self, movie_id):
+        row = self.db.execute("SELECT id, name, year, duration, genres FROM movies WHERE id = ?",
+                              (movie_id,)).fetchone()
+        return row_to_movie(row) if row else None
+
+    def delete(self, movie_id):
+        """Delete by id; False if there was no such movie."""
+        with self.transaction():
+            return self.db.execute("DELETE FROM movies WHERE id = ?", (movie_id,)).rowcount > 0
+
+    def page(self, after_id=0, limit=50):
+        """Up to limit movies with id > after_id, in id order."""
+        rows = self.db.execute("SELECT id, name, year, duration, genres FROM movies WHERE id > ? ORDER BY id LIMIT ?",
+                               (after_id, limit))
+        return [row_to_movie(row) for row in rows]
+
+    def load(self):
+        """The whole catalogue as {id: movie}, in id order."""
+        rows = self.db.execute("SELECT id, name, year, duration, genres FROM movies ORDER BY id")
+        return {row[0]: row_to_movie(row) for row in rows}
+
+    def import_movies(self, movies):
+        """Insert many movies in a single transaction; returns how many."""
+        with self.transaction():
+            cur = self.db.executemany("INSERT INTO movies (name, year, duration, genres) VALUES (?, ?, ?, ?)",
+                                      (movie_to_row(movie) for movie in movies))
+        return cur.rowcount
+
+    def import_file(self, path):
+        """Import a JSON list of movies or a CSV with name,year,duration,genres columns."""
+        if path.lower().endswith(".json"):
+            with open(path) as f:
+                return self.import_movies(json.load(f))
+        with open(path, newline="") as f:
+            return self.import_movies(csv.DictReader(f))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3 or sys.argv[2] not in ("import", "count") or (sys.argv[2] == "import" and len(sys.argv) < 4):
+        print("usage: python movie_store.py DB import FILE.json|FILE.csv ...\n"
+              "       python movie_store.py DB count")
+        sys.exit(2)
+    with MovieStore(sys.argv[1]) as store:
+        if sys.argv[2] == "import":
+            for path in sys.argv[3:]:
+                t = time.perf_counter()
+                n = store.import_file(path)
+                print("Imported", n, "movies from", os.path.basename(path), "in", round(time.perf_counter() - t, 2), "s")
+        print(store.count(), "movies in", sys.argv[1])
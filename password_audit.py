@@ -0,0 +1,146 @@
+"""Audit a file of passwords against the password policy.
+
+Two versions of the policy exist:
+
+* weeklyassignment.py Question9 gives one point each for length > 8, a
+  digit, an uppercase letter, a lowercase letter and one of
+  '!@#$%^&*()_+'.  Five points is strong, 3-4 medium, otherwise weak.
+* regex1.ipynb's `passs` regex needs a lowercase and an uppercase ASCII
+  letter, a digit and one of '@$!%*?&', with at least 8 characters and no
+  characters outside those sets.
+
+score() checks both in one pass.  It builds a set of the string's distinct
+characters, which is a single C-level traversal, and then ORs together a
+cached bitmask of classes for each distinct character.  It uses the same
+str.isdigit/isupper/islower tests as Question9, so non-ASCII characters
+score exactly as they do there.
+
+Large files are split into newline-aligned byte ranges that worker
+processes read and score themselves, so only the counts travel back:
+
+    python password_audit.py passwords.txt --jobs 4
+"""
+import argparse
+import collections
+import multiprocessing
+import os
+import time
+
+SPECIALS = "!@#$%^&*()_+"          # Question9
+POLICY_SPECIALS = "@$!%*?&"        # regex1 `passs`
+LABELS = ("strong", "medium", "weak")
+
+# character class bits
+DIGIT, UPPER, LOWER, SPECIAL = 1, 2, 4, 8
+ASCII_LOWER, ASCII_UPPER, DECIMAL, POLICY_SPECIAL, OTHER = 16, 32, 64, 128, 256
+POLICY_CLASSES = ASCII_LOWER | ASCII_UPPER | DECIMAL | POLICY_SPECIAL
+
+_classes = {}
+
+
+def char_classes(char):
+    bits = _classes.get(char)
+    if bits is None:
+        bits = ((DIGIT if char.isdigit() else 0) | (UPPER if char.isupper() else 0)
+                | (LOWER if char.islower() else 0) | (SPECIAL if char in SPECIALS else 0)
+                | (ASCII_LOWER if "a" <= char <= "z" else 0) | (ASCII_UPPER if "A" <= char <= "Z" else 0)
+                # regex \d matches Unicode decimal digits, which is str.isdecimal()
+                | (DECIMAL if char.isdecimal() else 0) | (POLICY_SPECIAL if char in POLICY_SPECIALS else 0))
+        if not bits & POLICY_CLASSES:
+            bits |= OTHER
+        _classes[char] = bits
+    return bits
+
+
+def score(password):
+    """(Question9 strength 0-5, whether regex1's pattern matches)."""
+    bits = 0
+    for char in set(password):
+        bits |= char_classes(char)
+    strength = ((len(password) > 8) + bool(bits & DIGIT) + bool(bits & UPPER)
+                + bool(bits & LOWER) + bool(bits & SPECIAL))
+    policy = len(password) >= 8 and bits & (POLICY_CLASSES | OTHER) == POLICY_CLASSES
+    return strength, policy
+
+
+def label(strength):
+    if strength == 5:
+        return "strong"
+    elif 3 <= strength < 5:
+        return "medium"
+    return "weak"
+
+
+# --- Streaming ---
+def audit_lines(lines):
+    """Counter of (label, regex policy passed) over an iterable of passwords."""
+    counts = collections.Counter()
+    for password in lines:
+        strength, policy = score(password)
+        counts[label(strength), policy] += 1
+    return counts
+
+
+def chunk_bounds(path, chunk_bytes):
+    """Byte ranges covering the file, each ending just after a newline."""
+    size = os.path.getsize(path)
+    bounds = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()
+            end = min(f.tell(), size)
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def audit_range(task):
+    path, start, end = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start).decode("utf-8", errors="surrogateescape")
+    lines = data.split("\n")
+    if lines[-1] == "":
+        lines.pop()  # the final newline does not start another password
+    return audit_lines(line[:-1] if line.endswith("\r") else line for line in lines)
+
+
+def audit_file(path, jobs=None, chunk_bytes=8 << 20):
+    """Score every line of path (one password per line) across jobs processes."""
+    tasks = [(path, start, end) for start, end in chunk_bounds(path, chunk_bytes)]
+    jobs = min(jobs or os.cpu_count() or 1, max(len(tasks), 1))
+    counts = collections.Counter()
+    if jobs == 1:
+        for task in tasks:
+            counts.update(audit_range(task))
+        return counts
+    with multiprocessing.Pool(jobs) as pool:
+        for part in pool.imap_unordered(audit_range, tasks):
+            counts.update(part)
+    return counts
+
+
+def report(counts, seconds, size):
+    total = sum(counts.values())
+    print("%-8s %12s %8s %16s" % ("category", "passwords", "share", "regex1 policy ok"))
+    for name in LABELS:
+        n = counts[name, True] + counts[name, False]
+        print("%-8s %12d %7.1f%% %16d" % (name, n, 100 * n / max(total, 1), counts[name, True]))
+    print("%-8s %12d %8s %16d" % ("total", total, "", sum(counts[name, True] for name in LABELS)))
+    print("%.2f s, %.0f passwords/s, %.1f MB/s" % (seconds, total / max(seconds, 1e-9), size / 1e6 / max(seconds, 1e-9)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Count passwords per policy category.")
+    parser.add_argument("path", help="text file, one password per line")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-mb", type=float, default=8, help="MB of the file per task")
+    args = parser.parse_args()
+    if not os.path.isfile(args.path):
+        parser.error("no such file: " + args.path)
+
+    t = time.perf_counter()
+    counts = audit_file(args.path, args.jobs, int(args.chunk_mb * (1 << 20)))
+    report(counts, time.perf_counter() - t, os.path.getsize(args.path))
@@ -0,0 +1,150 @@
+"""Population projections from "2023_Countries by Population.csv".
+
+popanalysis.ipynb adds pop2025 by hand as pop2023 + 2 * pop2023 *
+growthRate and fills the gaps in netChange and worldPercentage one
+column at a time.  Here the pop1980...pop2050 columns become one
+(countries x years) matrix, and:
+
+* interpolate() gives every country's population in any list of years,
+  log-linear between the known years (constant growth rate between
+  them) and carrying the nearest interval's growth rate past either end;
+* project() runs any number of growth-rate scenarios from a base year
+  in one broadcast, returning a (scenarios x countries x years) array;
+* fill_gaps() fills netChange and worldPercentage the way the notebook
+  does, without shadowing the builtin sum.
+
+    python population.py          # checks against the notebook, then a scenario sweep benchmark
+"""
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CSV = os.path.join(HERE, "2023_Countries by Population.csv")
+YEARS = np.array([1980, 2000, 2010, 2022, 2023, 2030, 2050])
+POP_COLUMNS = ["pop%d" % year for year in YEARS]
+
+
+def load(path=CSV):
+    return pd.read_csv(path)
+
+
+def population_matrix(df):
+    """(countries x len(YEARS)) float array of the pop columns."""
+    return df[POP_COLUMNS].to_numpy(dtype=float)
+
+
+def interpolate(pops, targets, years=YEARS):
+    """Population of every row of pops in each target year.
+
+    pops is (countries x len(years)); returns (countries x len(targets)).
+    Between two known years the growth rate is constant, so the known
+    values are hit exactly; outside them the first or last interval's
+    rate continues.
+    """
+    targets = np.asarray(targets, dtype=float)
+    # interval i runs from years[i] to years[i + 1]
+    i = np.clip(np.searchsorted(years, targets, side="right") - 1, 0, len(years) - 2)
+    frac = (targets - years[i]) / (years[i + 1] - years[i])
+    start, end = pops[:, i], pops[:, i + 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        geometric = start * (end / start) ** frac
+    # zero or missing anchors: fall back to a straight line
+    return np.where(np.isfinite(geometric) & (start > 0), geometric, start + (end - start) * frac)
+
+
+def project(base, growth, targets, base_year=2023, compound=True):
+    """Project base populations under each growth scenario.
+
+    base is (countries,) and growth broadcasts against (scenarios x
+    countries): a scalar, one rate per country, one per scenario as a
+    (scenarios x 1) column, or a full matrix.  Returns (scenarios x
+    countries x len(targets)); compound=False gives the notebook's
+    pop2023 + years * pop2023 * growthRate instead of compounding.
+    """
+    growth = np.atleast_2d(np.asarray(growth, dtype=float))[..., None]
+    years = np.asarray(targets, dtype=float) - base_year
+    base = np.atleast_1d(np.asarray(base, dtype=float))[None, :, None]
+    if compound:
+        return base * (1 + growth) ** years
+    return base * (1 + growth * years)
+
+
+def scenarios(rates, multipliers=(1.0,), offsets=(0.0,)):
+    """(len(multipliers) * len(offsets)) x countries matrix of rates * m + o."""
+    multipliers = np.asarray(multipliers, dtype=float)[:, None, None]
+    offsets = np.asarray(offsets, dtype=float)[None, :, None]
+    return (np.asarray(rates, dtype=float) * multipliers + offsets).reshape(-1, len(rates))
+
+
+def with_years(df, targets):
+    """Copy of df with a popYYYY column for each target year not already present."""
+    values = interpolate(population_matrix(df), targets)
+    new = {"pop%d" % year: values[:, k] for k, year in enumerate(targets) if "pop%d" % year not in df}
+    return df.assign(**new)
+
+
+def fill_gaps(df):
+    """Copy of df with netChange and worldPercentage filled as in the notebook.
+
+    netChange: the mean yearly change over the six intervals between the
+    pop columns, divided by 1000.  worldPercentage: pop2023 over the
+    total pop2023.
+    """
+    pops = population_matrix(df)
+    yearly = np.diff(pops, axis=1) / np.diff(YEARS)
+    world_total = np.nansum(df["pop2023"].to_numpy(dtype=float))
+    return df.assign(netChange=df["netChange"].fillna(pd.Series(yearly.mean(axis=1) / 1000, index=df.index)),
+                     worldPercentage=df["worldPercentage"].fillna(df["pop2023"] / world_total))
+
+
+# --- Checks and benchmark ---
+def notebook(data):
+    # popanalysis.ipynb's cells, with the chained inplace fillnas assigned back
+    data = data.copy()
+    data.insert(6, 'pop2025', data.loc[:, 'pop2023'] + ((data.loc[:, 'pop2023'] * data.loc[:, 'growthRate']) * 2))
+    a = [(data.loc[:, 'pop2000'] - data.loc[:, 'pop1980']) / 20, (data.loc[:, 'pop2010'] - data.loc[:, 'pop2000']) / 10,
+         (data.loc[:, 'pop2022'] - data.loc[:, 'pop2010']) / 12, (data.loc[:, 'pop2023'] - data.loc[:, 'pop2022']),
+         (data.loc[:, 'pop2030'] - data.loc[:, 'pop2023']) / 7, (data.loc[:, 'pop2050'] - data.loc[:, 'pop2030']) / 20]
+    total = a[0]
+    for change in a[1:]:
+        total = total + change
+    data['netChange'] = data['netChange'].fillna((total / len(a)) / 1000)
+    data['worldPercentage'] = data['worldPercentage'].fillna(data.loc[:, 'pop2023'] / data['pop2023'].sum())
+    return data
+
+
+if __name__ == "__main__":
+    data = load()
+    pops = population_matrix(data)
+    old = notebook(data)
+    filled = fill_gaps(data)
+    notebook_2025 = project(data["pop2023"], data["growthRate"], [2025], compound=False)[0, :, 0]
+    print("fill_gaps matches the notebook:",
+          np.allclose(filled["netChange"], old["netChange"]) and np.allclose(filled["worldPercentage"],
+                                                                               old["worldPercentage"]))
+    print("non-compounded 2025 matches the notebook's pop2025:", np.allclose(notebook_2025, old["pop2025"]))
+    print("interpolation hits the known years:", np.allclose(interpolate(pops, YEARS), pops))
+
+    world = interpolate(pops, [2025, 2040, 2060, 2100]).sum(axis=0)
+    print("\nworld population, interpolated / extrapolated:",
+          ", ".join("%d: %.2f bn" % (year, total / 1e9) for year, total in zip([2025, 2040, 2060, 2100], world)))
+
+    targets = np.arange(2024, 2101)
+    rates = scenarios(data["growthRate"].to_numpy(), np.linspace(0.5, 1.5, 100), np.linspace(-0.002, 0.002, 10))
+    t = time.perf_counter()
+    result = project(data["pop2023"], rates, targets)
+    sweep = time.perf_counter() - t
+    t = time.perf_counter()
+    for scenario in rates[:20]:
+        frame = data[["country", "pop2023"]].copy()
+        for year in targets:
+            frame["pop%d" % year] = frame["pop2023"] * (1 + pd.Series(scenario, index=frame.index)) ** (year - 2023)
+    loop = (time.perf_counter() - t) * len(rates) / 20
+    print("\n%d scenarios x %d countries x %d years: %.0f ms in one broadcast (%.2f ms per scenario),"
+          " ~%.1f s column by column" % (result.shape[0], result.shape[1], result.shape[2], sweep * 1000,
+                                        sweep * 1000 / len(rates), loop))
+    low, high = result[:, :, -1].sum(axis=1).min(), result[:, :, -1].sum(axis=1).max()
+    print("world population in 2100 across the scenarios: %.1f - %.1f bn" % (low / 1e9, high / 1e9))
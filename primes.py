@@ -0,0 +1,241 @@
+"""Sieve-based prime engine (NumPy).
+
+weeklyassignment.py's is_prime() does trial division for each number on
+its own.  This module sieves instead:
+
+* sieve(n) is a sieve of Eratosthenes over odd numbers only, crossing off
+  each prime's multiples with one strided slice assignment;
+* primes_in_range(lo, hi) / count_primes(lo, hi) walk [lo, hi) in
+  segments of SEGMENT odd numbers, so memory stays flat for ranges up to
+  10^9 and beyond;
+* is_prime(n) / is_prime_many(values) look numbers up in a cached bitset
+  (one bit per odd number, built segment by segment) that lookups grow
+  up to AUTO_GROW and grow() up to MAX_CACHED; larger numbers use a
+  deterministic Miller-Rabin test.
+
+    python primes.py 1e6 1e7 1e8 1e9     # benchmark against trial division
+"""
+import math
+import sys
+import time
+
+import numpy as np
+
+# Odd numbers per segment of the segmented sieve (a 2 MiB bool array).
+SEGMENT = 1 << 21
+# Largest number the cached bitset grows to (10^9 is 62.5 MB of bits).
+MAX_CACHED = 10 ** 9
+# Lookups only grow the bitset by themselves this far (1 MB of bits);
+# past it, call grow() first or let Miller-Rabin answer.
+AUTO_GROW = 1 << 24
+# Miller-Rabin with these bases is exact for every n < 3.3 * 10^24.
+WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+# --- Sieves ---
+def odd_sieve(n):
+    """Bool array s with s[i] True iff 2*i + 1 <= n is prime."""
+    s = np.ones((n + 1) // 2, dtype=bool)
+    if len(s):
+        s[0] = False  # 1
+    for i in range(1, (math.isqrt(n) - 1) // 2 + 1):
+        if s[i]:
+            p = 2 * i + 1
+            s[p * p // 2::p] = False
+    return s
+
+
+def sieve(n):
+    """All primes <= n, ascending, as an int64 array."""
+    odd = np.flatnonzero(odd_sieve(n)) * 2 + 1
+    return np.concatenate(([2], odd)) if n >= 2 else odd
+
+
+def odd_blocks(first, last):
+    """Yield (start, seg) covering the odd indexes [first, last) SEGMENT at a time.
+
+    Odd number 2*i + 1 has index i; seg[k] is True iff 2*(start + k) + 1
+    is prime.
+    """
+    if last <= first:
+        return
+    base = sieve(math.isqrt(2 * last - 1))[1:]  # odd primes up to sqrt of the largest number
+    for start in range(first, last, SEGMENT):
+        stop = min(start + SEGMENT, last)
+        seg = np.ones(stop - start, dtype=bool)
+        lo_num, hi_num = 2 * start + 1, 2 * stop + 1
+        for p in base:
+            p = int(p)
+            if p * p >= hi_num:
+                break
+            # first odd multiple of p that is >= max(p*p, lo_num)
+            m = max(p * p, -(-lo_num // p) * p)
+            if m % 2 == 0:
+                m += p
+            seg[m // 2 - start::p] = False
+        if start == 0:
+            seg[0] = False  # 1
+        yield start, seg
+
+
+def segments(lo, hi):
+    """Yield arrays of the primes in [lo, hi), one segment at a time."""
+    lo = max(lo, 2)
+    if hi <= lo:
+        return
+    if lo == 2:
+        yield np.array([2], dtype=np.int64)
+    for start, seg in odd_blocks(lo // 2, hi // 2):
+        yield np.flatnonzero(seg) * 2 + (2 * start + 1)
+
+
+def primes_in_range(lo, hi):
+    """Primes p with lo <= p < hi (like range), ascending, as an int64 array."""
+    parts = list(segments(lo, hi))
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
+
+def count_primes(lo, hi):
+    """Number of primes p with lo <= p < hi, without keeping them."""
+    return sum(len(part) for part in segments(lo, hi))
+
+
+# --- Membership ---
+def miller_rabin(n):
+    if n < 2:
+        return False
+    for p in WITNESSES:
+        if n % p == 0:
+            return n == p
+    d, r = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        r += 1
+    for a in WITNESSES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(r - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+class PrimeBitset:
+    """Primality of every number up to limit, one bit per odd number.
+
+    Batch lookups past limit grow the table (at least doubling it) up to
+    AUTO_GROW, so repeated lookups cost a shift and a mask; anything the
+    table does not cover goes to miller_rabin().
+    """
+
+    def __init__(self, limit=1 << 16):
+        self.limit = 0
+        self.bits = np.zeros(0, dtype=np.uint8)
+        self.grow(limit)
+
+    def grow(self, limit):
+        """Cover every number up to limit (capped at MAX_CACHED).
+
+        Sieves one SEGMENT at a time straight into the packed bits, so the
+        only full-size allocation is the bitset itself.
+        """
+        limit = min(max(limit, 2 * self.limit), MAX_CACHED)
+        if limit > self.limit:
+            odd = (limit + 1) // 2
+            bits = np.zeros((odd + 7) // 8, dtype=np.uint8)
+            for start, seg in odd_blocks(0, odd):
+                packed = np.packbits(seg, bitorder="little")
+                bits[start // 8:start // 8 + len(packed)] = packed  # SEGMENT is a multiple of 8
+            self.bits, self.limit = bits, limit
+
+    def __contains__(self, n):
+        n = int(n)
+        if n > self.limit:
+            return miller_rabin(n)
+        return bool(self.lookup(np.array([n]))[0])
+
+    def lookup(self, values):
+        """Bool array, one per value; values must be ints of any shape."""
+        values = np.asarray(values)
+        result = np.zeros(values.shape, dtype=bool)
+        top = int(values.max()) if values.size else 0
+        if self.limit < top <= AUTO_GROW:
+            self.grow(top)
+        cached = (values >= 2) & (values <= self.limit)
+        odd = cached & (values % 2 == 1)
+        index = (values[odd] // 2).astype(np.int64)
+        result[odd] = ((self.bits[index >> 3] >> (index & 7).astype(np.uint8)) & 1) == 1
+        result[values == 2] = True
+        for position in zip(*np.nonzero(values > self.limit)):
+            result[position] = miller_rabin(int(values[position]))
+        return result
+
+
+_bitset = None
+
+
+def bitset():
+    """The shared PrimeBitset used by is_prime() and is_prime_many()."""
+    global _bitset
+    if _bitset is None:
+        _bitset = PrimeBitset()
+    return _bitset
+
+
+def is_prime(n):
+    return n in bitset()
+
+
+def is_prime_many(values):
+    """Vectorised is_prime: a bool array shaped like values."""
+    return bitset().lookup(values)
+
+
+# --- Benchmark ---
+def trial_division(n):
+    # weeklyassignment.py Question2, copied since that script prompts on import
+    if n <= 1:
+        return False
+    for i in range(2, int(n**0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
+
+
+def timed(func, *args):
+    t = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t
+
+
+if __name__ == "__main__":
+    limits = [int(float(arg)) for arg in sys.argv[1:]] or [10 ** 6, 10 ** 7, 10 ** 8]
+    print("%12s %12s %16s %12s %12s" % ("limit", "primes", "trial division*", "sieve", "segmented"))
+    for n in limits:
+        # Trial division is too slow to run to 10^9: time 10 windows of
+        # 10^4 numbers spread over [0, n] and scale up (midpoint rule).
+        windows = [range(n * k // 10 + n // 20, min(n * k // 10 + n // 20 + 10 ** 4, n)) for k in range(10)]
+        _, trial = timed(lambda: [trial_division(i) for window in windows for i in window])
+        trial *= n / sum(len(window) for window in windows)
+        count, segmented = timed(count_primes, 0, n + 1)
+        if n <= 2 * 10 ** 8:
+            full, whole = timed(sieve, n)
+            assert len(full) == count
+            whole = "%.2f s" % whole
+        else:
+            whole = "skipped"
+        print("%12d %12d %14.0f s %12s %10.2f s" % (n, count, trial, whole, segmented))
+
+    rng = np.random.default_rng(0)
+    queries = rng.integers(0, 10 ** 7, 10 ** 6)
+    _, build = timed(bitset().grow, 10 ** 7)
+    found, batch = timed(is_prime_many, queries)
+    _, loop = timed(lambda: [trial_division(int(q)) for q in queries[:10 ** 5]])
+    assert found[:10 ** 5].tolist() == [trial_division(int(q)) for q in queries[:10 ** 5]]
+    print("* estimated from a sample")
+    print("\n10^6 membership queries below 10^7: bitset %.3f s (+%.2f s to build), trial division ~%.1f s"
+          % (batch, build, loop * 10))
@@ -0,0 +1,172 @@
+"""Outbreak detection over the monthly disease series.
+
+Every (District, Disease) series is one row of a 2-D array with one
+column per month, so all series are scored at once:
+
+* the seasonal baseline of a month is the mean of the same calendar month
+  in the previous ``SEASON_YEARS`` years;
+* the excess over that baseline is scored in units of the standard
+  deviation of the previous ``WINDOW`` residuals (a rolling z-score of
+  the deseasonalized series).
+
+A month scoring ``THRESHOLD`` or more is flagged.  Scores only look
+backwards, so appending a month scores one new column and leaves the
+history untouched (:meth:`AnomalyModel.update`).
+"""
+import warnings
+
+import numpy as np
+import pandas as pd
+
+SEASON_YEARS = 3
+WINDOW = 12
+MIN_PERIODS = 6
+# Floor for the rolling spread, in cases, so flat series do not score inf.
+MIN_SCALE = 1.0
+THRESHOLD = 3.0
+
+
+def series_matrix(disease):
+    """``(keys, first_month, values)``: one row of monthly cases per series.
+
+    ``keys`` is a (District, Disease) MultiIndex and missing months are NaN.
+    """
+    districts = disease["District"].cat.categories
+    diseases = disease["Disease"].cat.categories
+    keys = pd.MultiIndex.from_product([districts, diseases], names=["District", "Disease"])
+    months = disease["YearMonth"].to_numpy(dtype="int64")
+    first_month = int(months.min())
+
+    row = disease["District"].cat.codes.to_numpy(dtype="int64") * len(diseases) \
+        + disease["Disease"].cat.codes.to_numpy(dtype="int64")
+    col = months - first_month
+    values = np.zeros((len(keys), int(months.max()) - first_month + 1))
+    np.add.at(values, (row, col), disease["Cases"].to_numpy(dtype="float64"))
+    seen = np.zeros(values.shape, dtype=bool)
+    seen[row, col] = True
+    values[~seen] = np.nan
+    return keys, first_month, values
+
+
+def _lag(values, months):
+    """``values`` shifted right by ``months`` columns, NaN-padded."""
+    out = np.full(values.shape, np.nan)
+    if months < values.shape[1]:
+        out[:, months:] = values[:, :values.shape[1] - months]
+    return out
+
+
+def _spread(windows):
+    """Standard deviation over the last axis, NaN where too few values."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        std = np.nanstd(windows, axis=-1, ddof=1)
+    enough = np.sum(~np.isnan(windows), axis=-1) >= MIN_PERIODS
+    return np.where(enough, np.fmax(std, MIN_SCALE), np.nan)
+
+
+def score_history(values):
+    """``(baseline, residual, score)`` arrays for every series and month."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        baseline = np.nanmean(np.stack([_lag(values, 12 * k) for k in range(1, SEASON_YEARS + 1)]), axis=0)
+    residual = values - baseline
+    # windows[:, t] holds the WINDOW residuals before month t.
+    padded = np.concatenate([np.full((len(values), WINDOW), np.nan), residual[:, :-1]], axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, WINDOW, axis=1)
+    return baseline, residual, residual / _spread(windows)
+
+
+def month_of(date):
+    date = pd.Timestamp(date)
+    return date.year * 12 + date.month - 1
+
+
+class AnomalyModel:
+    """Scores for every series up to the last month of the data it has seen.
+
+    Instances are shared between dashboard sessions and never modified;
+    :meth:`update` returns a new model.
+    """
+
+    def __init__(self, keys, first_month, values, baseline, residual, score):
+        self.keys = keys
+        self.first_month = first_month
+        self.values = values
+        self.baseline = baseline
+        self.residual = residual
+        self.score = score
+
+    @classmethod
+    def fit(cls, disease):
+        keys, first_month, values = series_matrix(disease)
+        return cls(keys, first_month, values, *score_history(values))
+
+    @property
+    def last_month(self):
+        return self.first_month + self.values.shape[1] - 1
+
+    def append(self, cases):
+        """A model with one more month, scored from the history alone.
+
+        ``cases`` holds that month's cases in ``keys`` order (NaN if missing).
+        """
+        cases = np.asarray(cases, dtype="float64")
+        months = self.values.shape[1]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            baseline = np.nanmean(np.stack(
+                [self.values[:, months - 12 * k] if months >= 12 * k else np.full(len(cases), np.nan)
+                 for k in range(1, SEASON_YEARS + 1)]), axis=0)
+        residual = cases - baseline
+        window = self.residual[:, max(0, months - WINDOW):]
+        window = np.concatenate([np.full((len(cases), WINDOW - window.shape[1]), np.nan), window], axis=1)
+        return AnomalyModel(
+            self.keys, self.first_month,
+            np.column_stack([self.values, cases]),
+            np.column_stack([self.baseline, baseline]),
+            np.column_stack([self.residual, residual]),
+            np.column_stack([self.score, residual / _spread(window)]),
+        )
+
+    def update(self, disease):
+        """The model for ``disease``, appending only the months that are new.
+
+        Falls back to a full :meth:`fit` when the series or any month
+        already scored changed.
+        """
+        keys, first_month, values = series_matrix(disease)
+        seen = self.values.shape[1]
+        if (not keys.equals(self.keys) or first_month != self.first_month or values.shape[1] < seen
+                or not np.array_equal(values[:, :seen], self.values, equal_nan=True)):
+            return AnomalyModel.fit(disease)
+        model = self
+        for column in values[:, seen:].T:
+            model = model.append(column)
+        return model
+
+    def alerts(self, start=None, end=None, threshold=THRESHOLD):
+        """Flagged months between ``start`` and ``end``, highest score first."""
+        months = self.values.shape[1]
+        lo = 0 if start is None else min(max(0, month_of(start) - self.first_month), months)
+        hi = months if end is None else min(max(lo, month_of(end) - self.first_month + 1), months)
+        score = self.score[:, lo:hi]
+        with np.errstate(invalid="ignore"):
+            rows, cols = np.nonzero(score >= threshold)
+        cols = cols + lo
+        flagged = self.keys[rows].to_frame(index=False)
+        flagged["YearMonth"] = (cols + self.first_month).astype("int32")
+        flagged["Cases"] = self.values[rows, cols]
+        flagged["Baseline"] = self.baseline[rows, cols]
+        flagged["Score"] = self.score[rows, cols]
+        return flagged.sort_values("Score", ascending=False, ignore_index=True)
+
+    def series(self, district, disease_name):
+        """Cases, baseline and score of one series by month."""
+        row = self.keys.get_loc((district, disease_name))
+        return pd.DataFrame({
+            "YearMonth": np.arange(self.first_month, self.last_month + 1, dtype="int32"),
+            "Cases": self.values[row],
+            "Baseline": self.baseline[row],
+            "Score": self.score[row],
+        })
@@ -0,0 +1,86 @@
+"""Micro-benchmark: Period[M] month columns vs the int month key.
+
+Times each step the dashboard runs on the month column, once the way the
+dashboard used to (``to_period("M")``, grouping and merging on Periods,
+``.apply(lambda x: x.start_time)`` for chart axes) and once on the int
+key from :mod:`engine`:
+
+    python project/bench_month_key.py --repeat 20
+"""
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import engine
+
+CITY, DISEASE = "Pune", "Dengue"
+START, END = "2020-01-01", "2025-06-30"
+
+
+def period_frames(weather, disease):
+    weather = weather.assign(YearMonth=weather["time"].dt.to_period("M"))
+    disease = disease.assign(YearMonth=disease["Date"].dt.to_period("M"))
+    return weather, disease
+
+
+def period_join(weather, disease):
+    weather_filtered = engine.weather_slice(weather, CITY, START, END)
+    disease_filtered = engine.disease_series(disease, CITY, DISEASE, START, END)
+    monthly = weather_filtered.groupby("YearMonth").agg(
+        **{col: (col, how) for col, how in engine.MONTHLY_AGG.items()},
+        Date=("time", "max"),
+    ).reset_index()
+    return pd.merge(monthly, disease_filtered[["YearMonth", "Cases"]], on="YearMonth", how="inner")
+
+
+def all_cities(weather):
+    return weather.groupby("YearMonth").agg(
+        temperature_2m_max=("temperature_2m_max", "mean"),
+        precipitation_sum=("precipitation_sum", "sum"),
+    ).reset_index()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare Period and int month keys.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    weather, disease = engine.load_data()
+    p_weather, p_disease = period_frames(weather, disease)
+    p_joined = period_join(p_weather, p_disease)
+    i_joined = engine.monthly_join(weather, disease, CITY, DISEASE, START, END)
+    assert len(p_joined) == len(i_joined)
+    assert np.allclose(p_joined["temperature_2m_max"], i_joined["temperature_2m_max"], rtol=1e-5)
+
+    cases = {
+        "derive key (weather)": (
+            lambda: weather["time"].dt.to_period("M"),
+            lambda: engine.month_key(weather["time"]),
+        ),
+        "monthly join (one city)": (
+            lambda: period_join(p_weather, p_disease),
+            lambda: engine.monthly_join(weather, disease, CITY, DISEASE, START, END),
+        ),
+        "groupby month (all cities)": (
+            lambda: all_cities(p_weather),
+            lambda: all_cities(weather),
+        ),
+        "key -> label": (
+            lambda: p_joined["YearMonth"].astype(str),
+            lambda: [engine.month_label(k) for k in i_joined["YearMonth"]],
+        ),
+        "key -> chart axis": (
+            lambda: p_joined["YearMonth"].apply(lambda x: x.start_time),
+            lambda: engine.month_start(i_joined["YearMonth"]),
+        ),
+    }
+
+    print(f"{'step':<28} {'Period[M]':>12} {'int key':>12} {'speedup':>9}")
+    for name, (period, int_key) in cases.items():
+        t_period = min(timeit.repeat(period, number=1, repeat=args.repeat))
+        t_int = min(timeit.repeat(int_key, number=1, repeat=args.repeat))
+        print(f"{name:<28} {t_period * 1e3:10.3f}ms {t_int * 1e3:10.3f}ms {t_period / t_int:8.1f}x")
+    print(f"\nYearMonth column: {p_weather['YearMonth'].memory_usage(deep=True) / 2**10:.0f} KiB as Period, "
+          f"{weather['YearMonth'].memory_usage(deep=True) / 2**10:.0f} KiB as int")
@@ -0,0 +1,135 @@
+"""Offline throughput benchmark for the weather fetcher and parser.
+
+Starts ``mock_meteo.py`` in a subprocess (unless ``--url`` is given) and
+fetches N locations through ``meteo.fetch_daily``, reporting requests/s,
+wall time, a per-request latency histogram and peak memory.
+
+    python project/bench_scraper.py --locations 200 --workers 8 --latency 40 --rate-429 0.02
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from meteo import CITIES, MeteoError, fetch_daily
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def start_mock(args):
+    cmd = [
+        sys.executable, os.path.join(HERE, "mock_meteo.py"), "--port", "0",
+        "--latency", str(args.latency), "--jitter", str(args.jitter),
+        "--rate-429", str(args.rate_429), "--retry-after", str(args.retry_after),
+        "--malformed", str(args.malformed),
+    ]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    line = proc.stdout.readline()
+    if not line.startswith("listening on "):
+        proc.kill()
+        raise RuntimeError(f"mock server failed to start: {line!r}")
+    return proc, line.split()[-1]
+
+
+def locations(n):
+    """N distinct coordinates spread around the known cities."""
+    coords = list(CITIES.values())
+    out = []
+    for i in range(n):
+        lat, lon = coords[i % len(coords)]
+        out.append((lat + 0.01 * (i // len(coords)), lon))
+    return out
+
+
+def histogram(values, buckets=(5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)):
+    counts = [0] * (len(buckets) + 1)
+    for v in values:
+        for i, edge in enumerate(buckets):
+            if v <= edge:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    width = max(counts) or 1
+    labels = [f"<= {b} ms" for b in buckets] + [f"> {buckets[-1]} ms"]
+    return "\n".join(f"  {label:>11} {count:6d} {'#' * round(40 * count / width)}"
+                     for label, count in zip(labels, counts) if count)
+
+
+def percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def run(args, url):
+    local = threading.local()
+
+    def fetch(coord):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        t = time.perf_counter()
+        try:
+            df = fetch_daily(local.session, coord[0], coord[1], args.start, args.end,
+                             base_url=url, retries=args.retries, backoff=0.1)
+            ok, rows = True, len(df)
+        except (MeteoError, requests.RequestException):
+            ok, rows = False, 0
+        return (time.perf_counter() - t) * 1000, ok, rows
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        results = list(pool.map(fetch, locations(args.locations)))
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies = [r[0] for r in results]
+    ok = sum(r[1] for r in results)
+    rows = sum(r[2] for r in results)
+    print(f"locations      : {args.locations} ({ok} ok, {args.locations - ok} failed)")
+    print(f"rows parsed    : {rows:,}")
+    print(f"wall time      : {wall:.2f} s")
+    print(f"throughput     : {args.locations / wall:.1f} req/s, {rows / wall:,.0f} rows/s")
+    print(f"latency ms     : p50 {percentile(latencies, 50):.1f}  p95 {percentile(latencies, 95):.1f}"
+          f"  p99 {percentile(latencies, 99):.1f}  max {max(latencies):.1f}")
+    print(f"peak traced mem: {peak / 2**20:.1f} MiB")
+    print(f"max RSS        : {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MiB")
+    print("latency histogram:")
+    print(histogram(latencies))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--locations", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--start", default="2020-06-28")
+    parser.add_argument("--end", default="2025-06-30")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--url", help="benchmark an already running server instead of spawning the mock")
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--rate-429", type=float, default=0)
+    parser.add_argument("--retry-after", type=float, default=0.1)
+    parser.add_argument("--malformed", type=float, default=0)
+    args = parser.parse_args()
+    if args.locations < 1:
+        parser.error("--locations must be at least 1")
+
+    proc = None
+    url = args.url
+    if url is None:
+        proc, url = start_mock(args)
+    try:
+        run(args, url)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
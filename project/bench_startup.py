@@ -0,0 +1,87 @@
+"""Cold-start benchmark for dash.py.
+
+Every measurement runs in a fresh interpreter so nothing is already
+imported or cached in memory:
+
+* import time of each dependency stack the dashboard uses;
+* time-to-first-render of every page, driven with Streamlit's AppTest,
+  plus which plotting stacks ended up imported to render it.
+
+    python project/bench_startup.py --repeat 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DASH = os.path.join(HERE, "dash.py")
+
+STACKS = {
+    "streamlit": "import streamlit",
+    "pandas/numpy": "import pandas, numpy",
+    "plotly": "import plotly.express, plotly.graph_objects, plotly.subplots",
+    "matplotlib/seaborn": "import matplotlib.pyplot, seaborn",
+    "folium": "import folium, folium.plugins, streamlit_folium",
+}
+# Streamlit itself imports plotly.graph_objects for its chart theme, so
+# plotly.express is the marker for the dashboard's own plotly use.
+HEAVY = ["plotly.express", "matplotlib", "seaborn", "folium", "streamlit_folium"]
+PAGES = ["Home", "Filter & Insights", "EDA", "Alerts", "Info", "Contact"]
+
+IMPORT_CHILD = """
+import time
+t = time.perf_counter()
+{stmt}
+print(time.perf_counter() - t)
+"""
+
+RENDER_CHILD = """
+import json, sys, time
+t0 = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({dash!r}, default_timeout=300)
+at.run()
+t1 = time.perf_counter()
+page = {page!r}
+if page != "Home":
+    at.sidebar.radio[0].set_value(page).run()
+t2 = time.perf_counter()
+print(json.dumps({{
+    "first_run": t1 - t0,
+    "page": t2 - t1 if page != "Home" else t1 - t0,
+    "errors": len(at.exception),
+    "heavy": sorted(m for m in {heavy!r} if m in sys.modules),
+}}))
+"""
+
+
+def run_child(code):
+    # Run from the repo root, as `streamlit run project/dash.py` would be.
+    out = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(HERE),
+                         capture_output=True, text=True, check=True)
+    return out.stdout.strip().splitlines()[-1]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure dash.py import time and time-to-first-render.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print("Import time (cold interpreter, median of runs)")
+    for name, stmt in STACKS.items():
+        times = [float(run_child(IMPORT_CHILD.format(stmt=stmt))) for _ in range(args.repeat)]
+        print(f"  {name:<20} {statistics.median(times) * 1000:8.0f} ms")
+
+    print("\nTime to first render (cold process, median of runs)")
+    print(f"  {'page':<20} {'startup':>9} {'render':>9}  plotting stacks imported")
+    for page in PAGES:
+        results = [json.loads(run_child(RENDER_CHILD.format(dash=DASH, page=page, heavy=HEAVY)))
+                   for _ in range(args.repeat)]
+        startup = statistics.median(r["first_run"] for r in results)
+        render = statistics.median(r["page"] for r in results)
+        errors = " (script errors!)" if any(r["errors"] for r in results) else ""
+        heavy = ", ".join(results[-1]["heavy"]) or "none"
+        print(f"  {page:<20} {startup * 1000:7.0f}ms {render * 1000:7.0f}ms  {heavy}{errors}")
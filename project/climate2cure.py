@@ -0,0 +1,181 @@
+"""Headless Climate2Cure analytics and command line interface.
+
+``Engine`` is the same versioned, disk-cached engine the dashboard runs,
+so batch jobs reuse (and warm) the dashboard's cache without Streamlit.
+Summaries of whole years come from the ``reports.py`` table when it has
+been built for the current data.
+
+    python project/climate2cure.py query --city Pune --disease Dengue \\
+        --from 2021-01 --to 2024-12 --format parquet -o pune_dengue.parquet
+    python project/climate2cure.py rank --disease Dengue --from 2024-01 --to 2024-12
+"""
+import argparse
+import json
+import math
+import os
+import sys
+
+import pandas as pd
+
+import anomaly
+import datasets
+import disk_cache
+import engine
+import forecast
+import reports
+
+
+class Engine:
+    """Cached analytics over one version of the weather and disease data.
+
+    Frames can be passed in (the dashboard does this for shared-memory
+    mode); otherwise they are loaded through the disk cache.
+    """
+
+    def __init__(self, weather_version=None, disease_version=None, weather=None, disease=None):
+        if weather_version is None or disease_version is None:
+            weather_version, disease_version = datasets.dataset_versions()
+        self.weather_version = weather_version
+        self.disease_version = disease_version
+        self.weather = weather if weather is not None else datasets.load_weather(weather_version)
+        self.disease = disease if disease is not None else datasets.load_disease(disease_version)
+
+    def _key(self, *parts):
+        return (self.weather_version, self.disease_version) + tuple(str(p) for p in parts)
+
+    def monthly_join(self, city, disease_name, start, end):
+        return disk_cache.cached(
+            "monthly_join", self._key(city, disease_name, start, end),
+            lambda: engine.monthly_join(self.weather, self.disease, city, disease_name, start, end))
+
+    @property
+    def report_table(self):
+        """The prebuilt ``reports.py`` table for these versions, or None.
+
+        Reloaded whenever the file's mtime changes, so a table built while
+        the dashboard runs is picked up.
+        """
+        try:
+            mtime = os.stat(reports.report_path(self.weather_version, self.disease_version)).st_mtime_ns
+        except OSError:
+            mtime = None
+        if getattr(self, "_report_mtime", False) != mtime:
+            self._report_table = None if mtime is None else reports.load_table(self.weather_version,
+                                                                               self.disease_version)
+            self._report_mtime = mtime
+        return self._report_table
+
+    def summary(self, city, disease_name, start, end):
+        if reports.is_year_aligned(start, end) and self.report_table is not None:
+            return reports.summary_from_table(self.report_table, city, disease_name, start, end)
+        return disk_cache.cached(
+            "summary", self._key(city, disease_name, start, end),
+            lambda: engine.summarize(self.weather, self.disease,
+                                     self.monthly_join(city, disease_name, start, end),
+                                     city, disease_name, start, end))
+
+    def forecaster(self):
+        """Case forecasts for every district and disease (:mod:`forecast`)."""
+        return disk_cache.cached(
+            "forecast", self._key(),
+            lambda: forecast.Forecaster.fit(self.disease, engine.monthly_cube(self.weather)),
+            modules=(engine, anomaly, forecast))
+
+    def ranking(self, start, end, disease_name=None):
+        return disk_cache.cached(
+            "ranking", self._key(start, end, disease_name),
+            lambda: engine.severity_ranking(engine.disease_slice(self.disease, start, end), disease_name))
+
+
+# --- CLI ---
+def month_bound(value, end=False):
+    """``YYYY-MM`` -> first (or last) day of that month; full dates pass through.
+
+    Used as an argparse ``type``, so a bad value is a usage error.
+    """
+    try:
+        ts = pd.Timestamp(value)
+    except ValueError:
+        ts = pd.NaT
+    if ts is pd.NaT:
+        raise argparse.ArgumentTypeError(f"expected YYYY-MM or YYYY-MM-DD, got {value!r}")
+    if end and len(value) <= 7:
+        ts = ts + pd.offsets.MonthEnd(0)
+    return ts.date()
+
+
+def month_end(value):
+    return month_bound(value, end=True)
+
+
+def _clean(value):
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+def _readable(frame):
+    out = frame.copy()
+    if "YearMonth" in out:
+        out.insert(0, "Month", [engine.month_label(k) for k in out.pop("YearMonth")])
+    return out
+
+
+def write_frame(frame, fmt, path, extra=None):
+    frame = _readable(frame)
+    if fmt == "json":
+        payload = dict(extra or {})
+        payload["rows"] = json.loads(frame.to_json(orient="records", date_format="iso"))
+        text = json.dumps(payload, indent=2, default=str)
+        if path:
+            with open(path, "w") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+    elif fmt == "csv":
+        frame.to_csv(path or sys.stdout, index=False)
+    else:
+        if not path:
+            raise SystemExit("--format parquet needs --output")
+        frame.to_parquet(path, index=False)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="climate2cure", description="Climate2Cure analytics without the dashboard.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_common(p):
+        p.add_argument("--from", dest="start", default="2020-01", type=month_bound, help="YYYY-MM or YYYY-MM-DD")
+        p.add_argument("--to", dest="end", default="2025-06", type=month_end, help="YYYY-MM or YYYY-MM-DD (inclusive)")
+        p.add_argument("--format", choices=["json", "csv", "parquet"], default="json")
+        p.add_argument("-o", "--output", help="file to write (default stdout)")
+
+    query = sub.add_parser("query", help="monthly climate/cases join and headline metrics for one city and disease")
+    query.add_argument("--city", required=True)
+    query.add_argument("--disease", required=True)
+    add_common(query)
+
+    rank = sub.add_parser("rank", help="districts ranked by total cases")
+    rank.add_argument("--disease", help="rank by one disease (default: all diseases)")
+    add_common(rank)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    start, end = args.start, args.end
+    eng = Engine()
+
+    if args.command == "query":
+        summary = {k: _clean(v) for k, v in eng.summary(args.city, args.disease, start, end).items()}
+        write_frame(eng.monthly_join(args.city, args.disease, start, end), args.format, args.output,
+                    extra={"summary": summary})
+        if args.format != "json":
+            print(json.dumps(summary), file=sys.stderr)
+    else:
+        write_frame(eng.ranking(start, end, args.disease), args.format, args.output,
+                    extra={"disease": args.disease, "start": str(start), "end": str(end)})
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,19 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import seaborn as sns
-import matplotlib.pyplot as plt
-import folium
-from streamlit_folium import st_folium, folium_static
-from folium.plugins import HeatMap
-from plotly.subplots import make_subplots
-import plotly.graph_objects as go
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# The plotting stacks (plotly, matplotlib/seaborn, folium) are imported inside
+# the page or tab that uses them, so processes serving the Home, Info and
+# Contact pages never pay for them.  See bench_startup.py.
+
+import anomaly
+import climate2cure
+import datasets
+import disk_cache
+import engine
+import manifest
+import session_memory
+import shared_store
 
 # --- Page Configuration ---
 st.set_page_config(page_title="Climate2Cure Dashboard", layout="wide")
@@ -88,22 +94,85 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # --- Data Loading ---
-@st.cache_data
-def load_data():
-    weather = pd.read_csv("project/weather_2020_2025.csv", parse_dates=["time"])
-    disease = pd.read_csv("project/monthly_disease_cases_2020_2025.csv")
-    
-    weather["time"] = pd.to_datetime(weather["time"], errors="coerce")
-    disease["Date"] = pd.to_datetime(disease["Date"], errors="coerce")
-    
-    weather['YearMonth'] = weather['time'].dt.to_period('M')
-    disease['YearMonth'] = disease['Date'].dt.to_period('M')
-    
-    disease['YearMonthStr'] = disease['YearMonth'].astype('str')
-    
-    return weather, disease
-
-weather_df, disease_df = load_data()
+# Loaders are keyed by each file's dataset version, so a refresh published by
+# the scraper only reloads the frame that changed and old entries age out.
+# Each in-memory cache sits on top of a disk tier that survives restarts.
+# Cached frames are read-only and shared by every session (cache_resource
+# hands out the same object instead of a copy per rerun); pages only ever
+# slice or aggregate them.  In shared mode the large frames are also
+# memory-mapped Arrow files shared by every worker process.
+if shared_store.ENABLED:
+    def load_frame(name, version, build):
+        frame = shared_store.shared_frame(name, version, lambda: disk_cache.cached(name, version, build))
+        shared_store.prune(name, version)
+        return frame
+else:
+    def load_frame(name, version, build):
+        return disk_cache.cached(name, version, build)
+
+@st.cache_resource(max_entries=2)
+def load_weather(version):
+    return load_frame("weather", version, engine.load_weather)
+
+@st.cache_resource(max_entries=2)
+def load_disease(version):
+    return load_frame("disease", version, engine.load_disease)
+
+@st.cache_resource(max_entries=2)
+def load_monthly_cube(version, _weather):
+    return load_frame("monthly_cube", version, lambda: engine.monthly_cube(_weather))
+
+# The analytics run on the same headless engine as the climate2cure CLI.
+@st.cache_resource(max_entries=2)
+def get_engine(weather_version, disease_version):
+    return climate2cure.Engine(weather_version, disease_version,
+                               weather=load_weather(weather_version), disease=load_disease(disease_version))
+
+@st.cache_resource(max_entries=256)
+def query_monthly_join(weather_version, disease_version, city, disease, start, end):
+    return get_engine(weather_version, disease_version).monthly_join(city, disease, start, end)
+
+@st.cache_resource(max_entries=256)
+def query_summary(weather_version, disease_version, city, disease, start, end):
+    return get_engine(weather_version, disease_version).summary(city, disease, start, end)
+
+@st.cache_resource(max_entries=2)
+def load_forecaster(weather_version, disease_version):
+    return get_engine(weather_version, disease_version).forecaster()
+
+# The anomaly model is extended month by month when the disease data grows
+# rather than refit; anomaly_models() remembers the latest one.
+@st.cache_resource
+def anomaly_models():
+    return {}
+
+@st.cache_resource(max_entries=2)
+def load_anomalies(version):
+    disease = load_disease(version)
+    models = anomaly_models()
+    previous = models.get("latest")
+    model = anomaly.AnomalyModel.fit(disease) if previous is None else previous.update(disease)
+    models["latest"] = model
+    return model
+
+data_manifest = manifest.read_manifest()
+weather_version, disease_version = datasets.dataset_versions()
+weather_df = load_weather(weather_version)
+disease_df = load_disease(disease_version)
+
+# --- Per-Session Memory ---
+script_ctx = get_script_run_ctx()
+session_usage = session_memory.SessionUsage(script_ctx.session_id if script_ctx else "local")
+
+def capped_table(name, df):
+    """Count a table sent to the browser, truncating it if it would exceed the session cap."""
+    nbytes = engine.frame_bytes(df)
+    if not session_usage.fits(nbytes):
+        room = max(0, session_memory.SESSION_CAP_BYTES - session_usage.total)
+        keep = int(len(df) * room / nbytes) if nbytes else len(df)
+        st.caption(f"Showing the first {keep:,} of {len(df):,} rows to stay within the session memory cap.")
+        df = df.head(keep)
+    return session_usage.track(name, df)
 
 # --- Sidebar ---
 st.sidebar.title("Climate2Cure")
@@ -117,11 +186,11 @@ if 'selected_city' not in st.session_state:
     st.session_state.end_date = pd.to_datetime("2025-06-30").date()
 
 # Navigation
-page = st.sidebar.radio("Navigation", ["Home", "Filter & Insights", "EDA", "Info", "Contact"])
+page = st.sidebar.radio("Navigation", ["Home", "Filter & Insights", "EDA", "Alerts", "Info", "Contact"])
 st.sidebar.markdown("---")
 
 # --- CONDITIONAL FILTER WIDGETS ---
-if page in ["Filter & Insights", "EDA"]:
+if page in ["Filter & Insights", "EDA", "Alerts"]:
     st.sidebar.header("🔍 Analysis Filters")
 
     cities = sorted(disease_df["District"].unique())
@@ -134,6 +203,17 @@ if page in ["Filter & Insights", "EDA"]:
     st.sidebar.date_input("End Date", value=st.session_state.end_date, key='end_date')
 
     st.sidebar.markdown("---")
+
+debug_panel = st.sidebar.expander("🛠️ Debug")
+with debug_panel:
+    st.caption(f"Dataset version {data_manifest.get('version', 'unpublished')} · "
+               f"weather {weather_version} · disease {disease_version} · "
+               f"{'shared memory' if shared_store.ENABLED else 'per-process'} frames")
+    mem_report = engine.memory_report({"weather_df": weather_df, "disease_df": disease_df})
+    frame_totals = mem_report.groupby("frame")["bytes"].sum()
+    for frame_name, frame_bytes in frame_totals.items():
+        st.metric(frame_name, f"{frame_bytes / 2**20:.2f} MiB")
+    st.dataframe(mem_report, hide_index=True)
 # ----------------------------------
 
 # ----------------------------------------------------------------------
@@ -167,6 +247,8 @@ def home_page():
 
 # --- Filter & Insights Page ---
 def filter_insights_page(weather_df, disease_df):
+    import plotly.express as px
+
     st.markdown("<h1 style='text-align: center;'>🔍 Filter & Insights Setup</h1>", unsafe_allow_html=True)
     st.markdown("---")
 
@@ -175,70 +257,23 @@ def filter_insights_page(weather_df, disease_df):
     start_date_dt = pd.to_datetime(st.session_state.start_date)
     end_date_dt = pd.to_datetime(st.session_state.end_date)
     
-    weather_filtered = weather_df[
-        (weather_df["city"] == selected_city) &
-        (weather_df["time"] >= start_date_dt) &
-        (weather_df["time"] <= end_date_dt)
-    ].copy()
-
-    disease_filtered = disease_df[
-        (disease_df["Disease"] == selected_disease) &
-        (disease_df["District"].str.lower() == selected_city.lower()) &
-        (disease_df["Date"] >= start_date_dt) &
-        (disease_df["Date"] <= end_date_dt)
-    ].copy()
-
-    disease_filtered_all_cities = disease_df[
-        (disease_df["Date"] >= start_date_dt) &
-        (disease_df["Date"] <= end_date_dt)
-    ].copy()
-
-
-    weather_monthly_agg = weather_filtered.groupby('YearMonth').agg(
-        temperature_2m_max=('temperature_2m_max', 'mean'),
-        precipitation_sum=('precipitation_sum', 'sum'),
-        relative_humidity_2m_max=('relative_humidity_2m_max', 'mean'),
-        Date=('time', 'max') 
-    ).reset_index()
-
-    joined_df = pd.merge(
-        weather_monthly_agg,
-        disease_filtered[['YearMonth', 'Cases']], 
-        on='YearMonth',
-        how='inner'
-    )
-    
-    if not joined_df.empty:
-        peak_disease = joined_df.loc[joined_df['Cases'].idxmax()]
-        
-        corr_matrix = joined_df[['temperature_2m_max', 'precipitation_sum', 'relative_humidity_2m_max', 'Cases']].corr()
-        case_corr = corr_matrix['Cases'].drop('Cases').abs()
-        max_corr_var = case_corr.idxmax()
-        max_corr_value = corr_matrix.loc[max_corr_var, 'Cases']
-        max_corr_sign = 'Positive' if max_corr_value > 0 else 'Negative'
-        max_corr_name = max_corr_var.replace('_', ' ').title()
-        
-        total_cases_by_city = disease_filtered_all_cities.groupby('District')['Cases'].sum().reset_index()
-        total_cases_by_city['Rank'] = total_cases_by_city['Cases'].rank(ascending=False, method='min')
-        city_rank_data = total_cases_by_city[total_cases_by_city['District'] == selected_city]
-        city_rank = int(city_rank_data['Rank'].iloc[0]) if not city_rank_data.empty and not city_rank_data['Rank'].isna().all() else None
-        total_cities = len(total_cases_by_city)
-    else:
-        peak_disease = None
-        max_corr_value = None
-        max_corr_sign = 'N/A'
-        max_corr_name = 'N/A'
-        city_rank = None
-        total_cities = len(disease_df["District"].unique())
+    weather_filtered = engine.weather_slice(weather_df, selected_city, start_date_dt, end_date_dt)
+    disease_filtered = session_usage.track("disease_filtered", engine.disease_series(
+        disease_df, selected_city, selected_disease, start_date_dt, end_date_dt))
+    disease_filtered_all_cities = engine.disease_slice(disease_df, start_date_dt, end_date_dt)
 
-    expected_days = (end_date_dt - start_date_dt).days + 1
-    actual_days = weather_filtered.shape[0]
-    data_coverage = (actual_days / expected_days) * 100 if expected_days > 0 else 0
+    summary = query_summary(weather_version, disease_version, selected_city, selected_disease,
+                            st.session_state.start_date, st.session_state.end_date)
+
+    max_corr_value = summary['max_corr_value']
+    if max_corr_value is not None:
+        max_corr_sign = 'Positive' if max_corr_value > 0 else 'Negative'
+        max_corr_name = summary['max_corr_var'].replace('_', ' ').title()
 
 
     # --- INSIGHTS TABS ---
     st.subheader(f"Summary for: {selected_disease} in {selected_city}")
-    tabs = st.tabs(["📊 Overview", "🦠 Disease Trends", "🌡️ Climate Trends"])
+    tabs = st.tabs(["📊 Overview", "🦠 Disease Trends", "🌡️ Climate Trends", "🔮 Forecast"])
 
     # --- Overview Tab ---
     with tabs[0]:
@@ -246,19 +281,19 @@ def filter_insights_page(weather_df, disease_df):
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Total Disease Cases", f"{disease_filtered['Cases'].sum():,}")
-            if peak_disease is not None:
+            st.metric("Total Disease Cases", f"{summary['total_cases']:,}")
+            if summary['peak_cases'] is not None:
                 st.metric("Peak Case Month", 
-                          f"{int(peak_disease['Cases']):,} cases",
-                          help=f"Occurred in {peak_disease['YearMonth']}"
+                          f"{summary['peak_cases']:,} cases",
+                          help=f"Occurred in {summary['peak_month']}"
                           )
             
         with col2:
-            st.metric("Avg Max Temp (°C)", f"{weather_filtered['temperature_2m_max'].mean():.1f}")
-            st.metric("Total Rainfall (mm)", f"{weather_filtered['precipitation_sum'].sum():.1f}")
+            st.metric("Avg Max Temp (°C)", f"{summary['avg_max_temp']:.1f}")
+            st.metric("Total Rainfall (mm)", f"{summary['total_rainfall']:.1f}")
 
         with col3:
-            st.metric("Data Range (Months)", f"{joined_df.shape[0]} months")
+            st.metric("Data Range (Months)", f"{summary['months']} months")
             
             if max_corr_value is not None:
                 st.metric(f"Highest Correlation", 
@@ -273,13 +308,13 @@ def filter_insights_page(weather_df, disease_df):
 
         comp_col1, comp_col2 = st.columns(2)
         with comp_col1:
-            if city_rank is not None:
-                st.metric("Disease Severity Rank", f"#{city_rank}", help=f"Rank among {total_cities} cities for total {selected_disease} cases in the range.")
+            if summary['rank'] is not None:
+                st.metric("Disease Severity Rank", f"#{summary['rank']}", help=f"Rank among {summary['total_cities']} cities for total {selected_disease} cases in the range.")
             else:
                 st.metric("Disease Severity Rank", "N/A", help="Cannot calculate rank without case data.")
         
         with comp_col2:
-            st.metric("Climate Data Coverage", f"{data_coverage:.1f}%", help=f"Actual days of weather data ({actual_days}) vs. expected days ({expected_days}).")
+            st.metric("Climate Data Coverage", f"{summary['coverage']:.1f}%", help=f"Actual days of weather data ({summary['actual_days']}) vs. expected days ({summary['expected_days']}).")
 
 
     # --- Disease Trends Tab ---
@@ -313,7 +348,7 @@ def filter_insights_page(weather_df, disease_df):
                 st.plotly_chart(fig3, use_container_width=True)
             
             with col2:
-                city_disease = disease_filtered_all_cities.groupby(["District", "Disease"])["Cases"].sum().reset_index()
+                city_disease = disease_filtered_all_cities.groupby(["District", "Disease"], observed=True)["Cases"].sum().reset_index()
                 
                 if not city_disease.empty:
                     fig4 = px.bar(
@@ -350,13 +385,13 @@ def filter_insights_page(weather_df, disease_df):
         st.markdown("---")
         st.subheader("🗓️ Monthly Climate Aggregates (All Cities)")
         
-        climate_monthly = weather_df.groupby('YearMonth').agg({
+        climate_monthly = engine.cube_rollup(load_monthly_cube(weather_version, weather_df), {
             "temperature_2m_max": "mean",
             "relative_humidity_2m_max": "mean",
             "precipitation_sum": "sum"
-        }).reset_index()
+        })
         
-        climate_monthly['Month'] = climate_monthly['YearMonth'].apply(lambda x: x.start_time)
+        climate_monthly['Month'] = engine.month_start(climate_monthly['YearMonth'])
         
         col1, col2 = st.columns(2)
         with col1:
@@ -368,6 +403,126 @@ def filter_insights_page(weather_df, disease_df):
             fig2.update_layout(template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
             st.plotly_chart(fig2, use_container_width=True)
 
+
+    # --- Forecast Tab ---
+    with tabs[3]:
+        st.subheader(f"🔮 {selected_disease} Case Forecast for {selected_city}")
+        st.write("Linear models on the latest month's cases, temperature, rainfall and humidity "
+                 "and the cases a year earlier, fitted for every city and disease at once.")
+        forecaster = load_forecaster(weather_version, disease_version)
+        predictions = forecaster.predict(selected_city, selected_disease)
+
+        cols = st.columns(len(predictions))
+        for col, (month, cases, rmse) in zip(cols, predictions):
+            col.metric(engine.month_label(month), f"{cases:.0f} cases" if cases == cases else "N/A",
+                       help=f"Typical error ±{rmse:.1f} cases" if rmse == rmse else "Not enough history to fit a model.")
+
+        history_start, history_end = engine.month_start([forecaster.last_month - 23, forecaster.last_month])
+        history = engine.disease_series(disease_df, selected_city, selected_disease, history_start, history_end)
+        forecast_df = pd.DataFrame(predictions, columns=["YearMonth", "Cases", "RMSE"])
+        forecast_df["Month"] = engine.month_start(forecast_df["YearMonth"])
+
+        fig = px.bar(history, x="Date", y="Cases", color_discrete_sequence=["#00A896"],
+                     title=f"Last 24 Months and Next {len(predictions)} (forecast)")
+        fig.add_scatter(x=forecast_df["Month"], y=forecast_df["Cases"], mode="markers+lines", name="Forecast",
+                        marker=dict(color="#FFA500", size=10),
+                        error_y=dict(type="data", array=forecast_df["RMSE"], visible=True))
+        fig.update_layout(xaxis_title="Month", yaxis_title="Number of Cases", template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
+        st.plotly_chart(fig, use_container_width=True)
+
+        with st.expander("Model coefficients (1 month ahead)"):
+            st.dataframe(pd.Series(forecaster.coefficients(selected_city, selected_disease), name="Coefficient"))
+
+# --- Interactive EDA Sub-Views ---
+# A widget change inside a fragment reruns only that fragment, against the
+# cached joined_df it was called with, instead of the whole script.  On
+# Streamlit releases without fragments they rerun the page as before.
+fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda func: func)
+
+@fragment
+def pairplot_view(joined_df, available_cols):
+    import seaborn as sns
+
+    st.write("#### Climate-Disease Pairplot")
+
+    selected_features = st.multiselect(
+        "Select features for pairplot:",
+        available_cols,
+        default=[col for col in ["temperature_2m_max", "precipitation_sum", "relative_humidity_2m_max", "Cases"] if col in available_cols],
+        key='pairplot_multiselect_eda'
+    )
+
+    if st.button("Generate Pairplot", key='generate_pairplot_eda'):
+        if len(selected_features) >= 2:
+            sns.set_style("darkgrid", {"axes.facecolor": ".15", "grid.color": ".2", "xtick.color": "white", "ytick.color": "white", "axes.labelcolor": "white"})
+            pair_fig = sns.pairplot(joined_df[selected_features], corner=True, plot_kws={'alpha': 0.7, 'color': '#00A896'}, diag_kws={'color': '#00A896'})
+
+            for ax_row in pair_fig.axes:
+                for ax in ax_row:
+                    if ax:
+                        ax.tick_params(axis='x', colors='white')
+                        ax.tick_params(axis='y', colors='white')
+                        ax.set_xlabel(ax.get_xlabel(), color='white')
+                        ax.set_ylabel(ax.get_ylabel(), color='white')
+
+            pair_fig.fig.patch.set_alpha(0)
+            st.pyplot(pair_fig)
+        else:
+            st.warning("Please select at least two features for the pairplot.")
+
+@fragment
+def overlay_view(joined_df, selected_disease):
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    if not joined_df.empty:
+        climate_options = {
+            "Average Max Temperature (°C)": 'temperature_2m_max',
+            "Total Precipitation (mm)": 'precipitation_sum',
+            "Average Max Humidity (%)": 'relative_humidity_2m_max'
+        }
+
+        selected_climate_metric = st.selectbox(
+            "Select Climate Variable to Overlay:",
+            list(climate_options.keys()),
+            key='overlay_metric_eda'
+        )
+        climate_col = climate_options[selected_climate_metric]
+        overlay_df = joined_df[['Cases', climate_col]].assign(Month=engine.month_start(joined_df['YearMonth']))
+
+        fig_overlay = make_subplots(specs=[[{"secondary_y": True}]])
+
+        fig_overlay.add_trace(
+            go.Bar(x=overlay_df['Month'], y=overlay_df['Cases'], name=f'{selected_disease} Cases', marker_color='#00A896'),
+            secondary_y=False,
+        )
+
+        fig_overlay.add_trace(
+            go.Scatter(x=overlay_df['Month'], y=overlay_df[climate_col], name=selected_climate_metric, line=dict(color='#2a9df4', width=3)),
+            secondary_y=True,
+        )
+
+        fig_overlay.update_layout(
+            title_text=f'Monthly {selected_disease} Cases vs. {selected_climate_metric}',
+            template="plotly_dark", 
+            paper_bgcolor='rgba(0,0,0,0)', 
+            plot_bgcolor='rgba(0,0,0,0)',
+            hovermode="x unified",
+            legend=dict(yanchor="top", y=1.1, xanchor="left", x=0.01)
+        )
+
+        fig_overlay.update_xaxes(title_text="Month")
+
+        fig_overlay.update_yaxes(title_text=f"<b>{selected_disease} Cases</b>", secondary_y=False, title_font=dict(color='#00A896'))
+
+        fig_overlay.update_yaxes(title_text=f"<b>{selected_climate_metric}</b>", secondary_y=True, title_font=dict(color='#2a9df4'))
+
+        st.plotly_chart(fig_overlay, use_container_width=True)
+
+    else:
+        st.warning("No overlapping monthly data found to create the time-series overlay.")
+
+
 # --- EDA Visualization Page ---
 def eda_visualization_page(weather_df, disease_df):
     
@@ -380,34 +535,13 @@ def eda_visualization_page(weather_df, disease_df):
     st.markdown("---")
     st.subheader(f"Analyzing: {selected_disease} in {selected_city} ({start_date_dt.strftime('%Y')} - {end_date_dt.strftime('%Y')})")
 
-    weather_filtered = weather_df[
-        (weather_df["city"] == selected_city) &
-        (weather_df["time"] >= start_date_dt) &
-        (weather_df["time"] <= end_date_dt)
-    ].copy()
-
-    disease_filtered = disease_df[
-        (disease_df["Disease"] == selected_disease) &
-        (disease_df["District"].str.lower() == selected_city.lower()) &
-        (disease_df["Date"] >= start_date_dt) &
-        (disease_df["Date"] <= end_date_dt)
-    ].copy()
-
-    weather_monthly_agg = weather_filtered.groupby('YearMonth').agg(
-        temperature_2m_max=('temperature_2m_max', 'mean'),
-        temperature_2m_min=('temperature_2m_min', 'mean'),
-        precipitation_sum=('precipitation_sum', 'sum'),
-        relative_humidity_2m_max=('relative_humidity_2m_max', 'mean'),
-        relative_humidity_2m_min=('relative_humidity_2m_min', 'mean'),
-        windspeed_10m_max=('windspeed_10m_max', 'mean')
-    ).reset_index()
-        
-    joined_df = pd.merge(
-        weather_monthly_agg,
-        disease_filtered[['YearMonth', 'Cases']], 
-        on='YearMonth',
-        how='inner'
-    )
+    weather_filtered = engine.weather_slice(weather_df, selected_city, start_date_dt, end_date_dt)
+    disease_filtered = session_usage.track("disease_filtered", engine.disease_series(
+        disease_df, selected_city, selected_disease, start_date_dt, end_date_dt))
+
+    joined_df = query_monthly_join(weather_version, disease_version, selected_city, selected_disease,
+                                   st.session_state.start_date, st.session_state.end_date).drop(columns="Date")
+    session_usage.track("joined_df", joined_df)
 
     # --- Visualization Tabs ---
     tabs = st.tabs(["📈 Correlation","🔗 Time-Series Overlay", "📍 Map View", "📁 Data Explorer"])
@@ -415,6 +549,8 @@ def eda_visualization_page(weather_df, disease_df):
     # --- Correlation Tab ---
     with tabs[0]:
         st.subheader("📊 Climate vs. Disease Correlation Heatmap")
+        import matplotlib.pyplot as plt
+        import seaborn as sns
 
         if not joined_df.empty:
             numeric_cols = [
@@ -441,34 +577,8 @@ def eda_visualization_page(weather_df, disease_df):
             cbar.set_label("Correlation Coefficient", color='white')
             st.pyplot(fig)
             
-            # --- Pairplot Section ---
             st.markdown("---")
-            st.write("#### Climate-Disease Pairplot")
-            
-            selected_features = st.multiselect(
-                "Select features for pairplot:",
-                available_cols,
-                default=[col for col in ["temperature_2m_max", "precipitation_sum", "relative_humidity_2m_max", "Cases"] if col in available_cols],
-                key='pairplot_multiselect_eda'
-            )
-            
-            if st.button("Generate Pairplot", key='generate_pairplot_eda'):
-                if len(selected_features) >= 2:
-                    sns.set_style("darkgrid", {"axes.facecolor": ".15", "grid.color": ".2", "xtick.color": "white", "ytick.color": "white", "axes.labelcolor": "white"})
-                    pair_fig = sns.pairplot(joined_df[selected_features], corner=True, plot_kws={'alpha': 0.7, 'color': '#00A896'}, diag_kws={'color': '#00A896'})
-                    
-                    for ax_row in pair_fig.axes:
-                        for ax in ax_row:
-                            if ax:
-                                ax.tick_params(axis='x', colors='white')
-                                ax.tick_params(axis='y', colors='white')
-                                ax.set_xlabel(ax.get_xlabel(), color='white')
-                                ax.set_ylabel(ax.get_ylabel(), color='white')
-                        
-                    pair_fig.fig.patch.set_alpha(0)
-                    st.pyplot(pair_fig)
-                else:
-                    st.warning("Please select at least two features for the pairplot.")
+            pairplot_view(joined_df, available_cols)
 
         else:
             st.warning("No overlapping monthly data found for the selected city, disease, and date range to perform correlation analysis.")
@@ -477,59 +587,15 @@ def eda_visualization_page(weather_df, disease_df):
     with tabs[1]:
         st.subheader("🔗 Disease Cases vs. Climate Variable Over Time")
 
-        if not joined_df.empty:
-            
-            joined_df['Month'] = joined_df['YearMonth'].apply(lambda x: x.start_time)
-            
-            climate_options = {
-                "Average Max Temperature (°C)": 'temperature_2m_max',
-                "Total Precipitation (mm)": 'precipitation_sum',
-                "Average Max Humidity (%)": 'relative_humidity_2m_max'
-            }
-            
-            selected_climate_metric = st.selectbox(
-                "Select Climate Variable to Overlay:",
-                list(climate_options.keys()),
-                key='overlay_metric_eda'
-            )
-            climate_col = climate_options[selected_climate_metric]
-
-            fig_overlay = make_subplots(specs=[[{"secondary_y": True}]])
-
-            fig_overlay.add_trace(
-                go.Bar(x=joined_df['Month'], y=joined_df['Cases'], name=f'{selected_disease} Cases', marker_color='#00A896'),
-                secondary_y=False,
-            )
-
-            fig_overlay.add_trace(
-                go.Scatter(x=joined_df['Month'], y=joined_df[climate_col], name=selected_climate_metric, line=dict(color='#2a9df4', width=3)),
-                secondary_y=True,
-            )
-
-            fig_overlay.update_layout(
-                title_text=f'Monthly {selected_disease} Cases vs. {selected_climate_metric}',
-                template="plotly_dark", 
-                paper_bgcolor='rgba(0,0,0,0)', 
-                plot_bgcolor='rgba(0,0,0,0)',
-                hovermode="x unified",
-                legend=dict(yanchor="top", y=1.1, xanchor="left", x=0.01)
-            )
-
-            fig_overlay.update_xaxes(title_text="Month")
-            
-            fig_overlay.update_yaxes(title_text=f"<b>{selected_disease} Cases</b>", secondary_y=False, title_font=dict(color='#00A896'))
-
-            fig_overlay.update_yaxes(title_text=f"<b>{selected_climate_metric}</b>", secondary_y=True, title_font=dict(color='#2a9df4'))
-
-            st.plotly_chart(fig_overlay, use_container_width=True)
-            
-        else:
-            st.warning("No overlapping monthly data found to create the time-series overlay.")
+        overlay_view(joined_df, selected_disease)
 
 
     # --- Map View Tab ---
     with tabs[2]:
         st.subheader("🗺️ Disease Intensity Heatmap")
+        import folium
+        from folium.plugins import HeatMap
+        from streamlit_folium import st_folium
         
         district_coords = {
             "Mumbai": (19.0760, 72.8777), "Delhi": (28.7041, 77.1025),
@@ -539,13 +605,10 @@ def eda_visualization_page(weather_df, disease_df):
             "Jaipur": (26.9124, 75.7873), "Lucknow": (26.8467, 80.9462)
         }
         
-        map_data_filtered = disease_df[
-            (disease_df["Disease"] == selected_disease) &
-            (disease_df["Date"] >= start_date_dt) &
-            (disease_df["Date"] <= end_date_dt)
-        ].copy()
-        
-        map_data_agg = map_data_filtered.groupby('District')['Cases'].sum().reset_index()
+        cases_by_district = engine.disease_slice(disease_df, start_date_dt, end_date_dt).groupby(
+            ['Disease', 'District'], observed=True)['Cases'].sum()
+        map_cases = cases_by_district.get(selected_disease, pd.Series(dtype='int64', name='Cases'))
+        map_data_agg = map_cases.rename_axis('District').reset_index()
         
         map_data_agg["Latitude"] = map_data_agg["District"].map(lambda x: district_coords.get(x, (None, None))[0])
         map_data_agg["Longitude"] = map_data_agg["District"].map(lambda x: district_coords.get(x, (None, None))[1])
@@ -574,7 +637,27 @@ def eda_visualization_page(weather_df, disease_df):
                     fill_opacity=0.7,
                     popup=f"<div style='background-color: #2b2b2b; color: white; padding: 5px; border-radius: 3px;'>{row['District']}<br>Total Cases: {row['Cases']}</div>"
                 ).add_to(m)
-        
+
+        # Outbreak alerts layer: districts with flagged months in the range.
+        alerts = load_anomalies(disease_version).alerts(start_date_dt, end_date_dt)
+        alerts = alerts[alerts["Disease"] == selected_disease]
+        if not alerts.empty:
+            alert_layer = folium.FeatureGroup(name="🚨 Outbreak alerts")
+            for district, district_alerts in alerts.groupby("District", sort=False):
+                if district not in district_coords:
+                    continue
+                months = ", ".join(engine.month_label(k) for k in sorted(district_alerts["YearMonth"]))
+                folium.CircleMarker(
+                    location=district_coords[district],
+                    radius=min(10 + 4 * len(district_alerts), 30),
+                    color='red',
+                    weight=3,
+                    fill=False,
+                    popup=f"<div style='background-color: #2b2b2b; color: white; padding: 5px; border-radius: 3px;'>{district}<br>Alerts: {months}</div>"
+                ).add_to(alert_layer)
+            alert_layer.add_to(m)
+            folium.LayerControl().add_to(m)
+
         st_folium(m, width=700, height=500, use_container_width=True)
         if map_data_agg.empty:
              st.warning("No geographical data available for the selected disease and date range.")
@@ -585,10 +668,10 @@ def eda_visualization_page(weather_df, disease_df):
         st.write("Explore the filtered datasets used in the dashboard.")
         
         st.write("### Daily Weather Data (Filtered)")
-        st.dataframe(weather_filtered)
+        st.dataframe(capped_table("weather_table", weather_filtered))
         
         st.write("### Monthly Disease Data (Filtered)")
-        st.dataframe(disease_filtered)
+        st.dataframe(capped_table("disease_table", disease_filtered))
         
         if 'joined_df' in locals() and not joined_df.empty:
             csv = joined_df.to_csv(index=False).encode('utf-8')
@@ -600,6 +683,57 @@ def eda_visualization_page(weather_df, disease_df):
             )
 
 
+# --- Alerts Page ---
+def alerts_page():
+    import plotly.graph_objects as go
+
+    selected_city = st.session_state.selected_city
+    selected_disease = st.session_state.selected_disease
+    start_date_dt = pd.to_datetime(st.session_state.start_date)
+    end_date_dt = pd.to_datetime(st.session_state.end_date)
+
+    st.markdown("<h1 style='text-align: center;'>🚨 Outbreak Alerts</h1>", unsafe_allow_html=True)
+    st.markdown("---")
+    st.write("Months where a district's cases rose well above its seasonal baseline "
+             "(the same month in previous years), scored against the spread of its last "
+             f"{anomaly.WINDOW} months.")
+
+    model = load_anomalies(disease_version)
+    threshold = st.slider("Alert threshold (z-score)", 2.0, 5.0, anomaly.THRESHOLD, 0.25, key='alert_threshold')
+    alerts = model.alerts(start_date_dt, end_date_dt, threshold)
+
+    latest = alerts[alerts["YearMonth"] == model.last_month]
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Alerts in Range", f"{len(alerts):,}")
+    col2.metric("Districts Affected", f"{alerts['District'].nunique():,}")
+    col3.metric(f"Alerts in {engine.month_label(model.last_month)}", f"{len(latest):,}",
+                help="The latest month in the disease data.")
+
+    st.markdown("---")
+    st.subheader("📋 Flagged Months")
+    if not alerts.empty:
+        alerts_table = alerts.assign(Month=[engine.month_label(k) for k in alerts["YearMonth"]])
+        st.dataframe(capped_table("alerts_table", alerts_table[["Month", "District", "Disease", "Cases", "Baseline", "Score"]]),
+                     hide_index=True)
+    else:
+        st.info("No district crossed the alert threshold in the selected date range.")
+
+    st.markdown("---")
+    st.subheader(f"📈 {selected_disease} in {selected_city} vs. Seasonal Baseline")
+    series = model.series(selected_city, selected_disease)
+    series = series[(series["YearMonth"] >= anomaly.month_of(start_date_dt)) & (series["YearMonth"] <= anomaly.month_of(end_date_dt))]
+    series = series.assign(Month=engine.month_start(series["YearMonth"]))
+    flagged = series[series["Score"] >= threshold]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=series["Month"], y=series["Cases"], name="Cases", marker_color='#00A896'))
+    fig.add_trace(go.Scatter(x=series["Month"], y=series["Baseline"], name="Seasonal baseline", line=dict(color='#2a9df4', width=3)))
+    fig.add_trace(go.Scatter(x=flagged["Month"], y=flagged["Cases"], name="Alert", mode="markers",
+                             marker=dict(color='red', size=12, symbol='x')))
+    fig.update_layout(template="plotly_dark", paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                      xaxis_title="Month", yaxis_title="Number of Cases", hovermode="x unified")
+    st.plotly_chart(fig, use_container_width=True)
+
 # --- Info Page ---
 def info_page():
     st.markdown("<h1 style='text-align: center;'>ℹ️ Project Information</h1>", unsafe_allow_html=True)
@@ -650,7 +784,22 @@ elif page == "Filter & Insights":
     filter_insights_page(weather_df, disease_df) 
 elif page == "EDA":
     eda_visualization_page(weather_df, disease_df)
+elif page == "Alerts":
+    alerts_page()
 elif page == "Info":
     info_page()
 elif page == "Contact":
-    contact_page()
\ No newline at end of file
+    contact_page()
+
+# --- Session Memory Report ---
+session_usage.publish()
+with debug_panel:
+    st.markdown("---")
+    cap = session_memory.SESSION_CAP_BYTES
+    st.metric("This session", f"{session_usage.total / 2**20:.2f} MiB",
+              help=f"Cap: {cap / 2**20:.0f} MiB" if cap else "No cap set (CLIMATE2CURE_SESSION_MB)")
+    sessions = session_memory.snapshot()
+    st.caption(f"{len(sessions)} active session(s), "
+               f"{sum(total for _, total, _ in sessions) / 2**20:.2f} MiB private in total")
+    st.dataframe(pd.DataFrame([{"session": sid[:8], "bytes": total, **frames} for sid, total, frames in sessions]),
+                 hide_index=True)
@@ -0,0 +1,23 @@
+"""The weather and disease datasets by version, loaded through the disk cache.
+
+Shared by :class:`climate2cure.Engine` and the :mod:`reports` builder so
+that neither has to import the other.
+"""
+import disk_cache
+import engine
+import manifest
+
+
+def dataset_versions():
+    """``(weather_version, disease_version)`` of the files on disk."""
+    data_manifest = manifest.read_manifest()
+    return (manifest.dataset_version(engine.WEATHER_CSV, data_manifest),
+            manifest.dataset_version(engine.DISEASE_CSV, data_manifest))
+
+
+def load_weather(version):
+    return disk_cache.cached("weather", version, engine.load_weather)
+
+
+def load_disease(version):
+    return disk_cache.cached("disease", version, engine.load_disease)
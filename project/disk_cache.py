@@ -0,0 +1,105 @@
+"""Disk-backed cache tier that survives dashboard restarts.
+
+``st.cache_data`` only lives as long as the process.  Results stored here
+are pickled under ``project/.cache`` (or ``$CLIMATE2CURE_CACHE_DIR``) and
+keyed by the caller's key (which should include the dataset versions) plus
+a hash of the source code that produced them and of the pandas/NumPy
+versions that pickled them, so a deploy with changed analytics code or
+libraries never serves stale results.
+"""
+import hashlib
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+import engine
+from manifest import atomic_write
+
+CACHE_DIR = os.environ.get("CLIMATE2CURE_CACHE_DIR", os.path.join(engine.DATA_DIR, ".cache"))
+
+_code_versions = {}
+
+
+def code_version(*modules):
+    """Short hash of the source files of ``modules`` (engine by default).
+
+    The pandas and NumPy versions are hashed in too: their pickles do not
+    always load under another version.
+    """
+    paths = tuple(m.__file__ for m in modules or (engine,))
+    if paths not in _code_versions:
+        digest = hashlib.sha256(f"pandas {pd.__version__} numpy {np.__version__}".encode())
+        for path in paths:
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        _code_versions[paths] = digest.hexdigest()[:12]
+    return _code_versions[paths]
+
+
+def entry_path(name, key, modules=()):
+    digest = hashlib.sha256(f"{code_version(*modules)}|{key!r}".encode()).hexdigest()[:24]
+    return os.path.join(CACHE_DIR, name, f"{digest}.pkl")
+
+
+def cached(name, key, compute, modules=(), max_entries=256):
+    """Return the stored result for ``(name, key)`` or compute and store it.
+
+    ``key`` must be a repr-stable value (tuples of strings, numbers, dates).
+    Entries that fail to load for any reason (truncated, or pickled by
+    other library versions) are deleted and treated as misses; only the
+    ``max_entries`` most recently used entries per ``name`` are kept.
+    """
+    path = entry_path(name, key, modules)
+    try:
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    else:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    value = compute()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        def write(tmp):
+            with open(tmp, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        atomic_write(path, write)
+        _prune(os.path.dirname(path), max_entries)
+    except OSError:
+        pass  # a read-only or full disk just means no persistence
+    return value
+
+
+def _prune(directory, max_entries):
+    entries = [e for e in os.scandir(directory) if e.name.endswith(".pkl")]
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def clear(name=None):
+    """Remove every entry, or only those stored under ``name``."""
+    root = os.path.join(CACHE_DIR, name) if name else CACHE_DIR
+    for directory, _, files in os.walk(root):
+        for file in files:
+            if file.endswith(".pkl"):
+                os.remove(os.path.join(directory, file))
@@ -0,0 +1,302 @@
+"""Data loading and analytics helpers behind the Climate2Cure dashboard.
+
+Everything here is plain pandas/NumPy so it can be used without Streamlit.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+WEATHER_CSV = os.path.join(DATA_DIR, "weather_2020_2025.csv")
+DISEASE_CSV = os.path.join(DATA_DIR, "monthly_disease_cases_2020_2025.csv")
+
+WEATHER_VARS = [
+    "temperature_2m_max", "temperature_2m_min", "precipitation_sum",
+    "rain_sum", "snowfall_sum", "windspeed_10m_max",
+    "relative_humidity_2m_max", "relative_humidity_2m_min",
+]
+
+
+# --- Month keys ---
+def month_key(dates):
+    """Encode datetimes as ``year * 12 + month - 1`` (int32, -1 for NaT).
+
+    Computed straight from the datetime64 values (months since 1970), with
+    no Period objects or per-row year/month extraction.
+    """
+    dates = pd.Series(dates)
+    values = dates.to_numpy(dtype="datetime64[ns]")
+    key = values.astype("datetime64[M]").astype("int64") + 1970 * 12
+    key[np.isnat(values)] = -1
+    return pd.Series(key.astype("int32"), index=dates.index, name=dates.name)
+
+
+def month_start(keys):
+    """Vectorized inverse of :func:`month_key`: the first day of each month."""
+    keys = np.asarray(keys, dtype="int64")
+    return pd.to_datetime((keys - 1970 * 12).astype("datetime64[M]"))
+
+
+def month_label(key):
+    """``2021-08`` style label for a single month key."""
+    key = int(key)
+    return f"{key // 12}-{key % 12 + 1:02d}"
+
+
+# --- Loading ---
+def read_weather(path=WEATHER_CSV):
+    weather = pd.read_csv(path, parse_dates=["time"])
+    weather["time"] = pd.to_datetime(weather["time"], errors="coerce")
+    weather["YearMonth"] = month_key(weather["time"])
+    return weather
+
+
+def read_disease(path=DISEASE_CSV):
+    disease = pd.read_csv(path)
+    disease["Date"] = pd.to_datetime(disease["Date"], errors="coerce")
+    disease["YearMonth"] = month_key(disease["Date"])
+    return disease
+
+
+def compact(df, categories=()):
+    """Return a copy of ``df`` with compact dtypes.
+
+    Floats become float32, integers the smallest type that holds them and
+    the named string columns categoricals.
+    """
+    out = {}
+    for col in df.columns:
+        s = df[col]
+        if col in categories:
+            s = s.astype("category")
+        elif pd.api.types.is_float_dtype(s):
+            s = s.astype("float32")
+        elif pd.api.types.is_integer_dtype(s):
+            s = pd.to_numeric(s, downcast="integer")
+        out[col] = s
+    return pd.DataFrame(out, index=df.index)
+
+
+def load_weather(path=WEATHER_CSV):
+    """Compact weather frame sorted by city then time (see :func:`weather_slice`)."""
+    weather = compact(read_weather(path), categories=("city",))
+    return weather.sort_values(["city", "time"], kind="stable", ignore_index=True)
+
+
+def load_disease(path=DISEASE_CSV):
+    """Compact disease frame sorted by date (see :func:`disease_slice`)."""
+    disease = compact(read_disease(path), categories=("District", "Disease"))
+    return disease.sort_values("Date", kind="stable", ignore_index=True)
+
+
+def load_data():
+    """Load both datasets in their compact in-memory form."""
+    return load_weather(), load_disease()
+
+
+# --- Filtering ---
+# The loaded frames are treated as read-only and shared between sessions, so
+# filters return positional slices of them instead of boolean-mask copies
+# wherever the rows are contiguous.
+def _time_bounds(times, start, end):
+    lo = np.searchsorted(times, pd.Timestamp(start).to_datetime64(), side="left")
+    hi = np.searchsorted(times, pd.Timestamp(end).to_datetime64(), side="right")
+    return lo, hi
+
+
+def weather_slice(weather, city, start, end):
+    """Rows of ``city`` with ``start <= time <= end`` as a slice of ``weather``.
+
+    ``weather`` must be sorted by its categorical ``city`` then ``time``, as
+    :func:`load_weather` returns it.
+    """
+    code = weather["city"].cat.categories.get_indexer([city])[0]
+    if code < 0:
+        return weather.iloc[0:0]
+    codes = weather["city"].cat.codes.to_numpy()
+    first, last = np.searchsorted(codes, [code, code + 1])
+    lo, hi = _time_bounds(weather["time"].to_numpy()[first:last], start, end)
+    return weather.iloc[first + lo:first + hi]
+
+
+def disease_slice(disease, start, end):
+    """Rows with ``start <= Date <= end`` as a slice of the date-sorted ``disease``."""
+    lo, hi = _time_bounds(disease["Date"].to_numpy(), start, end)
+    return disease.iloc[lo:hi]
+
+
+def disease_series(disease, city, disease_name, start, end):
+    """Monthly cases of one disease in one district (matched case-insensitively)."""
+    in_range = disease_slice(disease, start, end)
+    return in_range[
+        (in_range["Disease"] == disease_name) &
+        (in_range["District"].str.lower() == city.lower())
+    ]
+
+
+# --- Aggregation ---
+# Monthly aggregation of the daily weather variables used by the analysis pages.
+MONTHLY_AGG = {
+    "temperature_2m_max": "mean",
+    "temperature_2m_min": "mean",
+    "precipitation_sum": "sum",
+    "relative_humidity_2m_max": "mean",
+    "relative_humidity_2m_min": "mean",
+    "windspeed_10m_max": "mean",
+}
+
+
+def monthly_cube(weather):
+    """Per (city, month) sums and counts of every weather variable.
+
+    Means and totals over any group of cities can be rebuilt exactly from
+    the cube with :func:`cube_rollup`, without touching the daily rows.
+    """
+    variables = [c for c in WEATHER_VARS if c in weather]
+    grouped = weather.groupby(["city", "YearMonth"], observed=True)
+    cube = pd.concat([
+        grouped.size().rename("days"),
+        grouped[variables].sum().add_suffix("_sum"),
+        grouped[variables].count().add_suffix("_count"),
+    ], axis=1)
+    return cube.reset_index()
+
+
+def cube_rollup(cube, aggs, by="YearMonth"):
+    """Aggregate the cube by ``by`` with ``{variable: "mean" | "sum"}``."""
+    grouped = cube.groupby(by, observed=True)
+    sums = grouped[[f"{var}_sum" for var in aggs]].sum()
+    out = pd.DataFrame(index=sums.index)
+    for var, how in aggs.items():
+        if how == "mean":
+            out[var] = sums[f"{var}_sum"] / grouped[f"{var}_count"].sum()
+        else:
+            out[var] = sums[f"{var}_sum"]
+    return out.reset_index()
+
+
+def monthly_join(weather, disease, city, disease_name, start, end):
+    """Monthly weather aggregates for one city joined with its case counts.
+
+    Works on the int month keys directly: the weather slice is sorted by
+    time, so each month is one run of rows and is aggregated with
+    ``np.add.reduceat``; the join is a ``searchsorted`` of the case months
+    into the (sorted, unique) weather months.
+    """
+    weather_filtered = weather_slice(weather, city, start, end)
+    disease_filtered = disease_series(disease, city, disease_name, start, end)
+
+    keys = weather_filtered["YearMonth"].to_numpy()
+    starts = np.flatnonzero(np.diff(keys, prepend=keys[:1] - 1))
+    months = keys[starts]
+    monthly = {"YearMonth": months}
+    for col, how in MONTHLY_AGG.items():
+        values = weather_filtered[col].to_numpy(dtype="float64")
+        present = ~np.isnan(values)
+        total = np.add.reduceat(np.where(present, values, 0.0), starts)
+        if how == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                total = total / np.add.reduceat(present, starts)
+        monthly[col] = total.astype("float32")
+    ends = np.flatnonzero(np.diff(keys, append=keys[-1:] + 1))
+    monthly["Date"] = weather_filtered["time"].to_numpy()[ends]
+
+    case_months = disease_filtered["YearMonth"].to_numpy()
+    pos = np.searchsorted(months, case_months)
+    hit = pos < len(months)
+    hit[hit] = months[pos[hit]] == case_months[hit]
+    joined = pd.DataFrame({col: values[pos[hit]] for col, values in monthly.items()})
+    joined["Cases"] = disease_filtered["Cases"].to_numpy()[hit]
+    return joined
+
+
+# --- Insights ---
+INSIGHT_VARS = ["temperature_2m_max", "precipitation_sum", "relative_humidity_2m_max"]
+
+
+def strongest_correlation(joined, variables=INSIGHT_VARS):
+    """The weather variable whose monthly values correlate most with Cases.
+
+    Returns ``(variable, signed correlation)`` or ``(None, None)`` when no
+    correlation can be computed.
+    """
+    corr_matrix = joined[variables + ["Cases"]].corr()
+    case_corr = corr_matrix["Cases"].drop("Cases").abs().dropna()
+    if case_corr.empty:
+        return None, None
+    variable = case_corr.idxmax()
+    return variable, float(corr_matrix.loc[variable, "Cases"])
+
+
+def severity_ranking(disease_in_range, disease_name=None):
+    """Total cases per district, ranked (1 = most cases).
+
+    Ranks over all diseases unless ``disease_name`` is given.
+    """
+    if disease_name is not None:
+        disease_in_range = disease_in_range[disease_in_range["Disease"] == disease_name]
+    ranking = disease_in_range.groupby("District", observed=True)["Cases"].sum().reset_index()
+    ranking["Rank"] = ranking["Cases"].rank(ascending=False, method="min").astype("int64")
+    return ranking.sort_values("Rank", kind="stable", ignore_index=True)
+
+
+def summarize(weather, disease, joined, city, disease_name, start, end):
+    """Headline metrics for one city, disease and date range.
+
+    ``joined`` is the matching :func:`monthly_join` result.  Missing metrics
+    are ``None``.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    weather_filtered = weather_slice(weather, city, start, end)
+    disease_filtered = disease_series(disease, city, disease_name, start, end)
+
+    summary = {
+        "city": city,
+        "disease": disease_name,
+        "start": start.date().isoformat(),
+        "end": end.date().isoformat(),
+        "total_cases": int(disease_filtered["Cases"].sum()),
+        "avg_max_temp": float(weather_filtered["temperature_2m_max"].mean()),
+        "total_rainfall": float(weather_filtered["precipitation_sum"].sum()),
+        "months": len(joined),
+        "peak_cases": None,
+        "peak_month": None,
+        "max_corr_var": None,
+        "max_corr_value": None,
+        "rank": None,
+        "total_cities": int(disease["District"].nunique()),
+    }
+    if not joined.empty:
+        peak = joined.loc[joined["Cases"].idxmax()]
+        summary["peak_cases"] = int(peak["Cases"])
+        summary["peak_month"] = month_label(peak["YearMonth"])
+        summary["max_corr_var"], summary["max_corr_value"] = strongest_correlation(joined)
+
+        ranking = severity_ranking(disease_slice(disease, start, end))
+        city_rank = ranking.loc[ranking["District"] == city, "Rank"]
+        summary["rank"] = int(city_rank.iloc[0]) if not city_rank.empty else None
+        summary["total_cities"] = len(ranking)
+
+    expected_days = (end - start).days + 1
+    summary["actual_days"] = len(weather_filtered)
+    summary["expected_days"] = expected_days
+    summary["coverage"] = summary["actual_days"] / expected_days * 100 if expected_days > 0 else 0
+    return summary
+
+
+# --- Diagnostics ---
+def frame_bytes(df):
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+def memory_report(frames):
+    """Bytes per column for each ``{name: DataFrame}``, largest first."""
+    rows = []
+    for name, df in frames.items():
+        usage = df.memory_usage(deep=True, index=True)
+        for col, nbytes in usage.items():
+            dtype = "index" if col == "Index" else str(df[col].dtype)
+            rows.append({"frame": name, "column": col, "dtype": dtype, "bytes": int(nbytes)})
+    report = pd.DataFrame(rows, columns=["frame", "column", "dtype", "bytes"])
+    return report.sort_values(["frame", "bytes"], ascending=[True, False], ignore_index=True)
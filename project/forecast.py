@@ -0,0 +1,134 @@
+"""Short-horizon case forecasts for every (District, Disease) series.
+
+One linear model per series and horizon ``h`` (months ahead) predicts
+the cases of month ``t`` from what is known at ``t - h``: that month's
+cases and monthly temperature, rainfall and humidity, plus the cases of
+the same month a year earlier.  All series and horizons are fitted
+together: the normal equations are built with one ``einsum`` and solved
+with one batched ``np.linalg.solve``.
+
+Fitting also computes the forecasts for the months after the data ends,
+so serving one is a dictionary lookup.
+"""
+import numpy as np
+
+import anomaly
+import engine
+
+HORIZONS = 3
+WEATHER_AGGS = {
+    "temperature_2m_max": "mean",
+    "precipitation_sum": "sum",
+    "relative_humidity_2m_max": "mean",
+}
+FEATURES = ["intercept", "cases", "cases_last_year"] + list(WEATHER_AGGS)
+# Small ridge term so series with collinear or constant features still solve.
+RIDGE = 1e-3
+# Series with fewer usable months than this get no model.
+MIN_MONTHS = 2 * len(FEATURES)
+
+
+def weather_matrix(cube, districts, first_month, months):
+    """``(variables, districts, months)`` array of monthly weather, NaN if missing."""
+    monthly = engine.cube_rollup(cube, WEATHER_AGGS, by=["city", "YearMonth"])
+    out = np.full((len(WEATHER_AGGS), len(districts), months), np.nan)
+    row = districts.get_indexer(monthly["city"])
+    col = monthly["YearMonth"].to_numpy(dtype="int64") - first_month
+    ok = (row >= 0) & (col >= 0) & (col < months)
+    for i, var in enumerate(WEATHER_AGGS):
+        out[i, row[ok], col[ok]] = monthly[var].to_numpy(dtype="float64")[ok]
+    return out
+
+
+def _shift(values, months):
+    """``values`` shifted ``months`` columns later along the last axis, NaN-padded."""
+    out = np.full(values.shape, np.nan)
+    if months < values.shape[-1]:
+        out[..., months:] = values[..., :values.shape[-1] - months]
+    return out
+
+
+def design(cases, weather, horizon):
+    """Features ``(series, months, FEATURES)`` for predicting each month ``horizon`` ahead."""
+    return np.stack(
+        [np.ones(cases.shape), _shift(cases, horizon), _shift(cases, 12)]
+        + list(_shift(weather, horizon)),
+        axis=-1,
+    )
+
+
+def last_year(cases, horizon):
+    """Cases of the month a year before ``horizon`` months after the last one.
+
+    NaN for every series when the history does not reach back that far.
+    """
+    month = cases.shape[1] - 1 + horizon - 12
+    if 0 <= month < cases.shape[1]:
+        return cases[:, month]
+    return np.full(len(cases), np.nan)
+
+
+def solve(X, y):
+    """Least-squares coefficients for a batch of problems, skipping NaN rows.
+
+    ``X`` is ``(batch, rows, k)`` and ``y`` is ``(batch, rows)``.  Returns
+    ``(coef, n)``; ``coef`` is NaN for problems with too few rows.
+    """
+    valid = ~np.isnan(X).any(axis=-1) & ~np.isnan(y)
+    X = np.where(valid[..., None], X, 0.0)
+    y = np.where(valid, y, 0.0)
+    xtx = np.einsum("btk,btl->bkl", X, X) + RIDGE * np.eye(X.shape[-1])
+    xty = np.einsum("btk,bt->bk", X, y)
+    coef = np.linalg.solve(xtx, xty[..., None])[..., 0]
+    n = valid.sum(axis=-1)
+    coef[n < MIN_MONTHS] = np.nan
+    return coef, n
+
+
+class Forecaster:
+    """Fitted coefficients and precomputed forecasts for one dataset version."""
+
+    def __init__(self, keys, last_month, coef, rmse, forecasts):
+        self.keys = keys
+        self.last_month = last_month
+        self.coef = coef            # (horizon, series, feature)
+        self.rmse = rmse            # (horizon, series)
+        self.forecasts = forecasts  # (horizon, series)
+        self._rows = {key: i for i, key in enumerate(keys)}
+
+    @classmethod
+    def fit(cls, disease, cube):
+        keys, first_month, cases = anomaly.series_matrix(disease)
+        months = cases.shape[1]
+        districts = keys.levels[0]
+        weather = weather_matrix(cube, districts, first_month, months)
+        weather = weather[:, keys.codes[0], :]  # one row per series
+
+        X = np.stack([design(cases, weather, h) for h in range(1, HORIZONS + 1)])
+        y = np.broadcast_to(cases, X.shape[:-1])
+        horizons, series, _, features = X.shape
+        coef, n = solve(X.reshape(-1, months, features), y.reshape(-1, months))
+        coef = coef.reshape(horizons, series, features)
+        n = n.reshape(horizons, series)
+
+        fitted = np.einsum("hstk,hsk->hst", X, coef)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            rmse = np.sqrt(np.nansum((fitted - y) ** 2, axis=-1) / n)
+
+        # Features for months last+1 .. last+HORIZONS, known at the last month.
+        forecasts = np.empty((horizons, series))
+        for h in range(1, horizons + 1):
+            x = np.column_stack([np.ones(series), cases[:, -1], last_year(cases, h)] + list(weather[:, :, -1]))
+            forecasts[h - 1] = np.einsum("sk,sk->s", x, coef[h - 1])
+        return cls(keys, first_month + months - 1, coef, rmse, np.maximum(forecasts, 0))
+
+    def predict(self, district, disease_name):
+        """``[(month key, cases, rmse)]`` for the next ``HORIZONS`` months."""
+        row = self._rows[(district, disease_name)]
+        return [(self.last_month + h + 1, float(self.forecasts[h, row]), float(self.rmse[h, row]))
+                for h in range(HORIZONS)]
+
+    def coefficients(self, district, disease_name, horizon=1):
+        """``{feature: coefficient}`` of one series' model."""
+        row = self._rows[(district, disease_name)]
+        return dict(zip(FEATURES, self.coef[horizon - 1, row].tolist()))
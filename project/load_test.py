@@ -0,0 +1,288 @@
+"""Concurrent-session load test for dash.py.
+
+Starts ``streamlit run project/dash.py`` on a free port (unless ``--url``
+is given) and drives N simulated browser sessions over Streamlit's
+websocket (``/_stcore/stream``), speaking its BackMsg/ForwardMsg
+protobufs.  Each session navigates between pages and changes the city,
+disease and date filters at random, with think time between actions; a
+rerun's latency is the time from sending it to its ``script_finished``.
+
+Reports throughput and p50/p95/p99 latency overall and per action, plus
+the server's CPU and memory sampled over the run:
+
+    python project/load_test.py --sessions 20 --duration 60 --ramp 10
+"""
+import argparse
+import asyncio
+import collections
+import datetime
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from bench_scraper import histogram, percentile
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DASH = os.path.join(HERE, "dash.py")
+
+# Relative weights of the actions a simulated user takes.
+ACTIONS = {"navigate": 3, "city": 3, "disease": 2, "dates": 2, "idle rerun": 1}
+PAGE_WEIGHTS = {"Home": 1, "Filter & Insights": 4, "EDA": 3, "Alerts": 2, "Info": 1}
+WIDGET_LABELS = {"navigate": "Navigation", "city": "Select City", "disease": "Select Disease"}
+FIRST_YEAR, LAST_YEAR = 2020, 2025
+
+
+# --- Server ---
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(timeout=120):
+    port = free_port()
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", DASH,
+        "--server.headless", "true", "--server.port", str(port),
+        "--server.fileWatcherType", "none", "--browser.gatherUsageStats", "false",
+    ]
+    # Run from the repo root, as `streamlit run project/dash.py` would be.
+    proc = subprocess.Popen(cmd, cwd=os.path.dirname(HERE),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"streamlit exited with code {proc.returncode}")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=2) as resp:
+                if resp.status == 200:
+                    return proc, f"ws://127.0.0.1:{port}/_stcore/stream"
+        except OSError:
+            time.sleep(0.25)
+    proc.kill()
+    raise RuntimeError("streamlit did not become healthy in time")
+
+
+class ProcessSampler:
+    """CPU % and RSS of the server process (psutil, or /proc on Linux)."""
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.proc = psutil.Process(pid) if psutil else None
+        self.last = self._cpu_seconds(), time.monotonic()
+
+    def _cpu_seconds(self):
+        if self.proc:
+            times = self.proc.cpu_times()
+            return times.user + times.system
+        with open(f"/proc/{self.pid}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+    def _rss(self):
+        if self.proc:
+            return self.proc.memory_info().rss
+        with open(f"/proc/{self.pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+    def sample(self):
+        """``(cpu percent since the last sample, rss bytes)``."""
+        cpu, now = self._cpu_seconds(), time.monotonic()
+        last_cpu, last_now = self.last
+        self.last = cpu, now
+        return 100 * (cpu - last_cpu) / max(now - last_now, 1e-9), self._rss()
+
+
+# --- Sessions ---
+class Session:
+    """One simulated browser tab."""
+
+    def __init__(self, url, rng):
+        self.url = url
+        self.rng = rng
+        self.ws = None
+        self.widgets = {}  # label -> (kind, widget id, options)
+        self.states = {}   # widget id -> WidgetState sent with every rerun
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.url, subprotocols=["streamlit"], max_size=None)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def rerun(self):
+        """Send a rerun with the current widget states and wait for it to finish.
+
+        Returns ``(seconds, bytes received, finished successfully)``.
+        """
+        msg = BackMsg()
+        msg.rerun_script.widget_states.widgets.extend(self.states.values())
+        started = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+
+        self.widgets = {}
+        received = 0
+        while True:
+            data = await self.ws.recv()
+            received += len(data)
+            fwd = ForwardMsg.FromString(data)
+            kind = fwd.WhichOneof("type")
+            if kind == "delta" and fwd.delta.WhichOneof("type") == "new_element":
+                self._see(fwd.delta.new_element)
+            elif kind == "script_finished":
+                status = fwd.script_finished
+                if status == ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    continue
+                return time.perf_counter() - started, received, status == ForwardMsg.FINISHED_SUCCESSFULLY
+
+    def _see(self, element):
+        kind = element.WhichOneof("type")
+        if kind in ("radio", "selectbox", "date_input"):
+            widget = getattr(element, kind)
+            self.widgets[widget.label] = (kind, widget.id, list(getattr(widget, "options", [])))
+
+    def _set(self, label, value):
+        kind, widget_id, _ = self.widgets[label]
+        state = self.states.get(widget_id)
+        if state is None:
+            state = self.states[widget_id] = BackMsg().rerun_script.widget_states.widgets.add()
+            state.id = widget_id
+        if kind == "date_input":
+            del state.string_array_value.data[:]
+            state.string_array_value.data.append(value)
+        else:
+            state.string_value = value
+
+    def choose(self):
+        """Pick an action the current page allows and apply it; returns its name."""
+        allowed = {a: w for a, w in ACTIONS.items()
+                   if a == "idle rerun" or (a == "dates" and "Start Date" in self.widgets)
+                   or WIDGET_LABELS.get(a) in self.widgets}
+        action = self.rng.choices(list(allowed), weights=list(allowed.values()))[0]
+        if action == "navigate":
+            self._set("Navigation", self.rng.choices(list(PAGE_WEIGHTS), weights=list(PAGE_WEIGHTS.values()))[0])
+        elif action in ("city", "disease"):
+            label = WIDGET_LABELS[action]
+            self._set(label, self.rng.choice(self.widgets[label][2]))
+        elif action == "dates":
+            first = self.rng.randint(FIRST_YEAR, LAST_YEAR)
+            last = self.rng.randint(first, LAST_YEAR)
+            # Half of the ranges are whole years, the rest start mid-year.
+            start = datetime.date(first, 1 if self.rng.random() < 0.5 else self.rng.randint(2, 12), 1)
+            self._set("Start Date", start.isoformat())
+            self._set("End Date", datetime.date(last, 12, 31).isoformat())
+        return action
+
+
+async def drive(session_no, args, url, results, deadline):
+    rng = random.Random(args.seed + session_no)
+    await asyncio.sleep(args.ramp * session_no / max(args.sessions, 1))
+    session = Session(url, rng)
+    try:
+        await session.connect()
+        action = "first load"
+        while time.monotonic() < deadline:
+            seconds, received, ok = await session.rerun()
+            results.append((time.monotonic(), action, seconds, received, ok))
+            await asyncio.sleep(rng.expovariate(1 / args.think) if args.think else 0)
+            action = session.choose()
+    except (OSError, websockets.WebSocketException) as exc:
+        results.append((time.monotonic(), "connection error", 0.0, 0, False))
+        print(f"session {session_no}: {exc}", file=sys.stderr)
+    finally:
+        await session.close()
+
+
+async def monitor(args, sampler, results, started, deadline, timeline):
+    seen = 0
+    while time.monotonic() < deadline:
+        await asyncio.sleep(args.interval)
+        window = results[seen:]
+        seen = len(results)
+        cpu, rss = sampler.sample() if sampler else (float("nan"), 0)
+        latencies = [r[2] * 1000 for r in window if r[4]]
+        row = (time.monotonic() - started, len(window) / args.interval,
+               percentile(latencies, 95) if latencies else float("nan"), cpu, rss)
+        timeline.append(row)
+        print(f"  {row[0]:6.0f}s {row[1]:8.1f} {row[2]:10.0f} {row[3]:7.0f} {row[4] / 2**20:9.0f}", flush=True)
+
+
+async def run(args, url, pid):
+    results, timeline = [], []
+    started = time.monotonic()
+    deadline = started + args.duration
+    sampler = ProcessSampler(pid) if pid else None
+    print(f"{args.sessions} sessions, {args.duration:.0f}s, ramp {args.ramp:.0f}s, think {args.think}s")
+    print(f"  {'time':>7} {'reruns/s':>8} {'p95 ms':>10} {'CPU %':>7} {'RSS MiB':>9}")
+    await asyncio.gather(
+        monitor(args, sampler, results, started, deadline, timeline),
+        *(drive(i, args, url, results, deadline) for i in range(args.sessions)),
+    )
+    wall = time.monotonic() - started
+    report(results, timeline, wall)
+
+
+def report(results, timeline, wall):
+    ok = [r for r in results if r[4]]
+    if not ok:
+        print("no successful reruns")
+        return
+    latencies = [r[2] * 1000 for r in ok]
+    print(f"\nreruns         : {len(results)} ({len(results) - len(ok)} failed)")
+    print(f"throughput     : {len(ok) / wall:.1f} reruns/s, {sum(r[3] for r in ok) / wall / 2**20:.2f} MiB/s sent")
+    print(f"latency ms     : p50 {percentile(latencies, 50):.0f}  p95 {percentile(latencies, 95):.0f}"
+          f"  p99 {percentile(latencies, 99):.0f}  max {max(latencies):.0f}")
+    if timeline:
+        cpu = [row[3] for row in timeline]
+        print(f"server         : CPU mean {sum(cpu) / len(cpu):.0f}% max {max(cpu):.0f}%,"
+              f" RSS peak {max(row[4] for row in timeline) / 2**20:.0f} MiB")
+    print(f"\n  {'action':<14} {'count':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    by_action = collections.defaultdict(list)
+    for r in ok:
+        by_action[r[1]].append(r[2] * 1000)
+    for action, values in sorted(by_action.items(), key=lambda item: -len(item[1])):
+        print(f"  {action:<14} {len(values):6d} {percentile(values, 50):8.0f} {percentile(values, 95):8.0f}"
+              f" {percentile(values, 99):8.0f}")
+    print("latency histogram:")
+    print(histogram(latencies))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Drive concurrent sessions against dash.py.")
+    parser.add_argument("--sessions", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--ramp", type=float, default=5, help="seconds over which sessions connect")
+    parser.add_argument("--think", type=float, default=1.0, help="mean think time between actions (s)")
+    parser.add_argument("--interval", type=float, default=5, help="sampling interval (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="websocket URL of a running server (ws://host:port/_stcore/stream)")
+    parser.add_argument("--pid", type=int, help="server pid to sample CPU/memory from (with --url)")
+    args = parser.parse_args()
+    if args.sessions < 1:
+        parser.error("--sessions must be at least 1")
+
+    proc = None
+    url, pid = args.url, args.pid
+    if url is None:
+        proc, url = start_server()
+        pid = proc.pid
+    try:
+        asyncio.run(run(args, url, pid))
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
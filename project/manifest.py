@@ -0,0 +1,99 @@
+"""Versioned dataset manifest shared by the scraper and the dashboard.
+
+The scraper publishes ``manifest.json`` next to the data files after every
+refresh.  Each dataset entry carries the SHA-256 of its file, and the
+top-level ``version`` hashes them together, so readers can tell exactly
+which datasets changed without re-reading them.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(DATA_DIR, "manifest.json")
+
+
+def file_digest(path, chunk_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def atomic_write(path, write, skip_unchanged=False):
+    """Call ``write(tmp_path)`` then move the result over ``path`` atomically.
+
+    With ``skip_unchanged`` the existing file is left alone when the new
+    content is byte-identical.  Returns True when ``path`` was replaced.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    os.close(fd)
+    try:
+        write(tmp)
+        # mkstemp creates 0600 files; keep the permissions readers expect.
+        os.chmod(tmp, os.stat(path).st_mode if os.path.exists(path) else 0o644)
+        if skip_unchanged and os.path.exists(path) and file_digest(tmp) == file_digest(path):
+            os.remove(tmp)
+            return False
+        os.replace(tmp, path)
+        return True
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def read_manifest(manifest_path=MANIFEST_PATH):
+    try:
+        with open(manifest_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def publish(paths, manifest_path=MANIFEST_PATH):
+    """Hash ``paths`` and atomically write the manifest; return it."""
+    datasets = {}
+    for path in paths:
+        st = os.stat(path)
+        datasets[os.path.basename(path)] = {
+            "sha256": file_digest(path),
+            "bytes": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+    combined = hashlib.sha256()
+    for name in sorted(datasets):
+        combined.update(f"{name}:{datasets[name]['sha256']}\n".encode())
+    manifest = {
+        "version": combined.hexdigest()[:16],
+        "published": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "datasets": datasets,
+    }
+
+    def write(tmp):
+        with open(tmp, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    atomic_write(manifest_path, write)
+    return manifest
+
+
+def dataset_version(path, manifest=None):
+    """Content version of one data file.
+
+    Uses the manifest hash when the file is listed there and has not been
+    touched since, otherwise falls back to its modification time and size
+    so unmanaged files still get a key that changes when they are rewritten.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "missing"
+    entry = (manifest or {}).get("datasets", {}).get(os.path.basename(path))
+    if entry and entry.get("mtime_ns") == st.st_mtime_ns and entry.get("bytes") == st.st_size:
+        return entry["sha256"][:16]
+    return f"{st.st_mtime_ns}-{st.st_size}"
@@ -0,0 +1,87 @@
+"""Open-Meteo archive client shared by the weather scraper and its benchmark."""
+import time
+
+import pandas as pd
+
+ARCHIVE_URL = "https://archive-api.open-meteo.com/v1/archive"
+
+DAILY_VARS = [
+    "temperature_2m_max", "temperature_2m_min", "precipitation_sum",
+    "rain_sum", "snowfall_sum", "windspeed_10m_max",
+    "relative_humidity_2m_max", "relative_humidity_2m_min",
+]
+
+HOURLY_VARS = [
+    "temperature_2m", "relative_humidity_2m", "precipitation",
+    "rain", "snowfall", "windspeed_10m",
+]
+
+TIMEZONE = "Asia/Kolkata"
+
+# The archive trails real time by a few days.
+ARCHIVE_LAG_DAYS = 5
+
+CITIES = {
+    "Ahmedabad": (23.0225, 72.5714),
+    "Mumbai": (19.0760, 72.8777),
+    "Delhi": (28.7041, 77.1025),
+    "Chennai": (13.0827, 80.2707),
+    "Bengaluru": (12.9716, 77.5946),
+    "Hyderabad": (17.3850, 78.4867),
+    "Jaipur": (26.9124, 75.7873),
+    "Kolkata": (22.5726, 88.3639),
+    "Lucknow": (26.8467, 80.9462),
+    "Pune": (18.5204, 73.8567)
+}
+
+
+class MeteoError(Exception):
+    """Raised when the archive API returns no usable data."""
+
+
+def fetch_archive(session, lat, lon, start_date, end_date, resolution="daily",
+                  base_url=ARCHIVE_URL, retries=3, backoff=2.0, timeout=60):
+    """Fetch the ``daily`` or ``hourly`` archive for one location as a DataFrame.
+
+    HTTP 429 responses are retried up to ``retries`` times, honouring the
+    ``Retry-After`` header when the server sends one.
+    """
+    variables = DAILY_VARS if resolution == "daily" else HOURLY_VARS
+    params = {
+        "latitude": lat,
+        "longitude": lon,
+        "start_date": start_date,
+        "end_date": end_date,
+        resolution: ",".join(variables),
+        "timezone": TIMEZONE,
+    }
+    for attempt in range(retries + 1):
+        response = session.get(base_url, params=params, timeout=timeout)
+        if response.status_code != 429 or attempt == retries:
+            break
+        time.sleep(float(response.headers.get("Retry-After", backoff * (attempt + 1))))
+    response.raise_for_status()
+
+    try:
+        data = response.json()
+    except ValueError as e:
+        raise MeteoError(f"malformed response body: {e}") from e
+    return parse_archive(data, resolution)
+
+
+def fetch_daily(session, lat, lon, start_date, end_date, **kwargs):
+    return fetch_archive(session, lat, lon, start_date, end_date, "daily", **kwargs)
+
+
+def fetch_hourly(session, lat, lon, start_date, end_date, **kwargs):
+    return fetch_archive(session, lat, lon, start_date, end_date, "hourly", **kwargs)
+
+
+def parse_archive(data, resolution="daily"):
+    """Turn an archive payload into one row per day (or hour)."""
+    if not isinstance(data, dict) or resolution not in data:
+        raise MeteoError(f"no '{resolution}' data returned")
+    try:
+        return pd.DataFrame(data[resolution])
+    except ValueError as e:
+        raise MeteoError(f"inconsistent '{resolution}' arrays: {e}") from e
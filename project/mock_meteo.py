@@ -0,0 +1,182 @@
+"""Local stand-in for the Open-Meteo archive API.
+
+Serves ``/v1/archive`` with synthetic but plausible ``daily`` or ``hourly``
+payloads so the scraper can be exercised and benchmarked offline.  Latency,
+HTTP 429 and malformed bodies can be injected with the command line flags
+below.
+
+    python project/mock_meteo.py --port 8099 --latency 50 --rate-429 0.05
+    python project/weather-scrap.py --url http://127.0.0.1:8099/v1/archive --delay 0
+"""
+import argparse
+import json
+import random
+import threading
+import time
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from math import cos, pi
+from urllib.parse import parse_qs, urlparse
+
+from meteo import DAILY_VARS, HOURLY_VARS, TIMEZONE
+
+
+def daily_payload(lat, lon, start_date, end_date, variables=DAILY_VARS):
+    """Build an archive-shaped response for one location.
+
+    Values follow a seasonal cycle plus noise and are seeded by the
+    coordinates, so the same request always returns the same data.
+    """
+    rng = random.Random(f"{lat:.4f},{lon:.4f}")
+    start = date.fromisoformat(start_date)
+    n_days = (date.fromisoformat(end_date) - start).days + 1
+    days = [start + timedelta(days=i) for i in range(n_days)]
+
+    base_temp = 34 - abs(lat - 20) * 0.4
+    columns = {"time": [d.isoformat() for d in days]}
+    for var in variables:
+        columns[var] = []
+
+    for d in days:
+        season = cos(2 * pi * (d.timetuple().tm_yday - 140) / 365)
+        monsoon = max(0.0, cos(2 * pi * (d.timetuple().tm_yday - 210) / 365))
+        t_max = base_temp + 6 * season + rng.gauss(0, 1.5)
+        t_min = t_max - 8 - rng.random() * 4
+        rain = rng.expovariate(1 / (12 * monsoon)) if monsoon > 0.3 and rng.random() < monsoon else 0.0
+        hum_max = min(100, 55 + 40 * monsoon + rng.gauss(0, 5))
+        row = {
+            "temperature_2m_max": round(t_max, 1),
+            "temperature_2m_min": round(t_min, 1),
+            "precipitation_sum": round(rain, 1),
+            "rain_sum": round(rain, 1),
+            "snowfall_sum": 0.0,
+            "windspeed_10m_max": round(8 + rng.random() * 15, 1),
+            "relative_humidity_2m_max": int(hum_max),
+            "relative_humidity_2m_min": int(max(5, hum_max - 30 - rng.random() * 15)),
+        }
+        for var in variables:
+            columns[var].append(row.get(var))
+
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "timezone": TIMEZONE,
+        "daily_units": {var: "" for var in variables},
+        "daily": columns,
+    }
+
+
+def hourly_payload(lat, lon, start_date, end_date, variables=HOURLY_VARS):
+    """Hourly counterpart of :func:`daily_payload`.
+
+    Each day's hours follow a diurnal cycle between that day's daily min and
+    max, and the daily rain total falls in the afternoon hours.
+    """
+    daily = daily_payload(lat, lon, start_date, end_date)["daily"]
+    columns = {"time": []}
+    for var in variables:
+        columns[var] = []
+
+    for i, day in enumerate(daily["time"]):
+        t_max, t_min = daily["temperature_2m_max"][i], daily["temperature_2m_min"][i]
+        h_max, h_min = daily["relative_humidity_2m_max"][i], daily["relative_humidity_2m_min"][i]
+        rain = daily["precipitation_sum"][i]
+        wind = daily["windspeed_10m_max"][i]
+        for hour in range(24):
+            warmth = (1 + cos(2 * pi * (hour - 15) / 24)) / 2
+            wet = rain / 6 if 13 <= hour < 19 else 0.0
+            row = {
+                "temperature_2m": round(t_min + (t_max - t_min) * warmth, 1),
+                "relative_humidity_2m": int(h_max - (h_max - h_min) * warmth),
+                "precipitation": round(wet, 2),
+                "rain": round(wet, 2),
+                "snowfall": 0.0,
+                "windspeed_10m": round(wind * (0.4 + 0.6 * warmth), 1),
+            }
+            columns["time"].append(f"{day}T{hour:02d}:00")
+            for var in variables:
+                columns[var].append(row.get(var))
+
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "timezone": TIMEZONE,
+        "hourly_units": {var: "" for var in variables},
+        "hourly": columns,
+    }
+
+
+class ArchiveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        opts = self.server.options
+        url = urlparse(self.path)
+        if url.path != "/v1/archive":
+            return self._send(404, b'{"error": true, "reason": "not found"}')
+
+        if opts.latency:
+            time.sleep(max(0.0, random.gauss(opts.latency, opts.jitter)) / 1000)
+        if random.random() < opts.rate_429:
+            return self._send(429, b'{"error": true, "reason": "Too many requests"}',
+                              {"Retry-After": str(opts.retry_after)})
+        if random.random() < opts.malformed:
+            return self._send(200, b'{"latitude": 0, "daily": {"time": ["2020-')
+
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        try:
+            location = (float(query["latitude"]), float(query["longitude"]),
+                        query["start_date"], query["end_date"])
+            if "hourly" in query:
+                payload = hourly_payload(*location, query["hourly"].split(","))
+            else:
+                payload = daily_payload(*location, query.get("daily", ",".join(DAILY_VARS)).split(","))
+        except (KeyError, ValueError) as e:
+            return self._send(400, json.dumps({"error": True, "reason": str(e)}).encode())
+        self._send(200, json.dumps(payload).encode())
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.options.verbose:
+            super().log_message(format, *args)
+
+
+def serve(options, background=False):
+    """Start the mock server; return it (running in a thread when ``background``)."""
+    server = ThreadingHTTPServer((options.host, options.port), ArchiveHandler)
+    server.daemon_threads = True
+    server.options = options
+    if background:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Mock Open-Meteo archive server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099, help="0 picks a free port")
+    parser.add_argument("--latency", type=float, default=0, help="mean added latency in ms")
+    parser.add_argument("--jitter", type=float, default=0, help="latency standard deviation in ms")
+    parser.add_argument("--rate-429", type=float, default=0, help="fraction of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1, help="Retry-After seconds sent with 429s")
+    parser.add_argument("--malformed", type=float, default=0, help="fraction of truncated JSON bodies")
+    parser.add_argument("--verbose", action="store_true")
+    return parser
+
+
+if __name__ == "__main__":
+    options = build_parser().parse_args()
+    server = serve(options)
+    print(f"listening on http://{options.host}:{server.server_port}/v1/archive", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,196 @@
+"""Precomputed per-(city, disease, year) summaries.
+
+For every district, disease and calendar year the builder stores totals,
+the peak month and the sufficient statistics of the climate/case
+correlations (n, sums, sums of squares and cross products).  Any range of
+whole years is then answered by adding rows, which gives exactly the
+metrics :func:`engine.summarize` computes from the raw data.
+
+    python project/reports.py --jobs 8
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import datasets
+import engine
+
+REPORT_DIR = os.path.join(engine.DATA_DIR, "reports")
+
+
+def report_path(weather_version, disease_version):
+    return os.path.join(REPORT_DIR, f"summary-{weather_version}-{disease_version}.csv")
+
+
+def is_year_aligned(start, end):
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    return (start.month, start.day) == (1, 1) and (end.month, end.day) == (12, 31) and start <= end
+
+
+# --- Per-year statistics ---
+def year_stats(weather, disease, city, diseases, year):
+    """One row of sufficient statistics per disease for ``city`` in ``year``."""
+    start, end = f"{year}-01-01", f"{year}-12-31"
+    weather_filtered = engine.weather_slice(weather, city, start, end)
+    in_range = engine.disease_slice(disease, start, end)
+    district_cases = int(in_range.loc[in_range["District"] == city, "Cases"].sum())
+
+    rows = []
+    for disease_name in diseases:
+        joined = engine.monthly_join(weather, disease, city, disease_name, start, end)
+        series = engine.disease_series(disease, city, disease_name, start, end)
+        row = {
+            "city": city,
+            "disease": disease_name,
+            "year": year,
+            "total_cases": int(series["Cases"].sum()),
+            "district_cases": district_cases,
+            "has_cases": not in_range.loc[in_range["District"] == city].empty,
+            "days": len(weather_filtered),
+            "temp_sum": float(weather_filtered["temperature_2m_max"].astype("float64").sum()),
+            "temp_n": int(weather_filtered["temperature_2m_max"].count()),
+            "rain_sum": float(weather_filtered["precipitation_sum"].astype("float64").sum()),
+            "months": len(joined),
+            "peak_cases": None,
+            "peak_month": None,
+        }
+        if not joined.empty:
+            peak = joined.loc[joined["Cases"].idxmax()]
+            row["peak_cases"] = int(peak["Cases"])
+            row["peak_month"] = engine.month_label(peak["YearMonth"])
+
+        # Per variable, over the months where both values exist (pairwise,
+        # like DataFrame.corr).
+        cases = joined["Cases"].to_numpy(dtype="float64")
+        for var in engine.INSIGHT_VARS:
+            x = joined[var].to_numpy(dtype="float64")
+            both = ~(np.isnan(x) | np.isnan(cases))
+            x, y = x[both], cases[both]
+            row[f"{var}_n"] = len(x)
+            row[f"{var}_x"], row[f"{var}_xx"] = x.sum(), (x * x).sum()
+            row[f"{var}_y"], row[f"{var}_yy"] = y.sum(), (y * y).sum()
+            row[f"{var}_xy"] = (x * y).sum()
+        rows.append(row)
+    return rows
+
+
+def _city_task(args):
+    weather_version, disease_version, city, diseases, years = args
+    weather, disease = _worker_frames(weather_version, disease_version)
+    rows = []
+    for year in years:
+        rows.extend(year_stats(weather, disease, city, diseases, year))
+    return rows
+
+
+_frames = {}
+
+
+def _worker_frames(weather_version, disease_version):
+    key = (weather_version, disease_version)
+    if key not in _frames:
+        _frames[key] = (datasets.load_weather(weather_version), datasets.load_disease(disease_version))
+    return _frames[key]
+
+
+def build(weather_version, disease_version, jobs=None):
+    """Compute the summary table for every city x disease x year in parallel."""
+    disease = datasets.load_disease(disease_version)
+    cities = sorted(disease["District"].unique())
+    diseases = sorted(disease["Disease"].unique())
+    dates = disease["Date"].dropna()
+    years = list(range(dates.min().year, dates.max().year + 1))
+    tasks = [(weather_version, disease_version, city, diseases, years) for city in cities]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        rows = [row for city_rows in pool.map(_city_task, tasks) for row in city_rows]
+    return pd.DataFrame(rows)
+
+
+# --- Lookup ---
+def _pearson(n, sx, sy, sxx, syy, sxy):
+    denom = np.sqrt((n * sxx - sx * sx) * (n * syy - sy * sy))
+    if n < 2 or not denom > 0:
+        return None
+    return float((n * sxy - sx * sy) / denom)
+
+
+def summary_from_table(table, city, disease_name, start, end):
+    """:func:`engine.summarize` for a year-aligned range, from the summary table.
+
+    Like engine, cases match the city case-insensitively while the weather
+    (and so everything joined to it) needs the exact name.
+    """
+    start, end = pd.Timestamp(start), pd.Timestamp(end)
+    in_years = table[(table["year"] >= start.year) & (table["year"] <= end.year)]
+    matching = in_years[(in_years["city"].str.lower() == city.lower()) & (in_years["disease"] == disease_name)]
+    rows = matching[matching["city"] == city].sort_values("year")
+
+    temp_n = rows["temp_n"].sum()
+    summary = {
+        "city": city,
+        "disease": disease_name,
+        "start": start.date().isoformat(),
+        "end": end.date().isoformat(),
+        "total_cases": int(matching["total_cases"].sum()),
+        "avg_max_temp": float(rows["temp_sum"].sum() / temp_n) if temp_n else float("nan"),
+        "total_rainfall": float(rows["rain_sum"].sum()),
+        "months": int(rows["months"].sum()),
+        "peak_cases": None,
+        "peak_month": None,
+        "max_corr_var": None,
+        "max_corr_value": None,
+        "rank": None,
+        "total_cities": int(table["city"].nunique()),
+    }
+    if summary["months"]:
+        peaks = rows.dropna(subset=["peak_cases"])
+        peak = peaks.loc[peaks["peak_cases"].idxmax()]
+        summary["peak_cases"] = int(peak["peak_cases"])
+        summary["peak_month"] = peak["peak_month"]
+
+        best = None
+        for var in engine.INSIGHT_VARS:
+            r = _pearson(*(rows[f"{var}_{stat}"].sum() for stat in ("n", "x", "y", "xx", "yy", "xy")))
+            if r is not None and (best is None or abs(r) > abs(best[1])):
+                best = (var, r)
+        if best is not None:
+            summary["max_corr_var"], summary["max_corr_value"] = best
+
+        per_city = in_years.drop_duplicates(["city", "year"])
+        per_city = per_city[per_city["has_cases"]].groupby("city")["district_cases"].sum()
+        ranks = per_city.rank(ascending=False, method="min")
+        summary["rank"] = int(ranks[city]) if city in ranks else None
+        summary["total_cities"] = len(per_city)
+
+    expected_days = (end - start).days + 1
+    summary["actual_days"] = int(rows["days"].sum())
+    summary["expected_days"] = expected_days
+    summary["coverage"] = summary["actual_days"] / expected_days * 100
+    return summary
+
+
+def load_table(weather_version, disease_version):
+    """The summary table for these dataset versions, or None if not built."""
+    path = report_path(weather_version, disease_version)
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, dtype={"peak_month": "string"})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the city x disease x year summary table.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    weather_version, disease_version = datasets.dataset_versions()
+    table = build(weather_version, disease_version, jobs=args.jobs)
+    os.makedirs(REPORT_DIR, exist_ok=True)
+    path = report_path(weather_version, disease_version)
+    table.to_csv(path, index=False)
+    print(f"✅ {len(table)} summaries written to '{path}' in {time.perf_counter() - started:.1f}s "
+          f"with {args.jobs} worker(s)")
@@ -0,0 +1,143 @@
+"""Streaming hourly -> daily -> monthly weather rollups.
+
+The hourly archive is read in chunks; each chunk is reduced to partial
+per-(city, day) aggregates (sum/count/min/max) that are merged as we go,
+so memory is bounded by the number of output rows rather than the number
+of hours.  The daily output has the same columns as the scraper's daily
+file, which is what the dashboard reads.
+
+    python project/rollup.py weather_hourly_2020_2025.csv
+"""
+import argparse
+import os
+
+import pandas as pd
+
+from engine import DATA_DIR, WEATHER_CSV, month_key
+from manifest import atomic_write
+
+HOURLY_CSV = os.path.join(DATA_DIR, "weather_hourly_2020_2025.csv")
+MONTHLY_CSV = os.path.join(DATA_DIR, "weather_monthly_2020_2025.csv")
+
+# output column: (input column, aggregation)
+DAILY_RULES = {
+    "temperature_2m_max": ("temperature_2m", "max"),
+    "temperature_2m_min": ("temperature_2m", "min"),
+    "precipitation_sum": ("precipitation", "sum"),
+    "rain_sum": ("rain", "sum"),
+    "snowfall_sum": ("snowfall", "sum"),
+    "windspeed_10m_max": ("windspeed_10m", "max"),
+    "relative_humidity_2m_max": ("relative_humidity_2m", "max"),
+    "relative_humidity_2m_min": ("relative_humidity_2m", "min"),
+    "temperature_2m_mean": ("temperature_2m", "mean"),
+    "relative_humidity_2m_mean": ("relative_humidity_2m", "mean"),
+}
+
+MONTHLY_RULES = {
+    "temperature_2m_max": ("temperature_2m_max", "mean"),
+    "temperature_2m_min": ("temperature_2m_min", "mean"),
+    "precipitation_sum": ("precipitation_sum", "sum"),
+    "rain_sum": ("rain_sum", "sum"),
+    "snowfall_sum": ("snowfall_sum", "sum"),
+    "windspeed_10m_max": ("windspeed_10m_max", "mean"),
+    "relative_humidity_2m_max": ("relative_humidity_2m_max", "mean"),
+    "relative_humidity_2m_min": ("relative_humidity_2m_min", "mean"),
+    "temperature_2m_mean": ("temperature_2m_mean", "mean"),
+    "relative_humidity_2m_mean": ("relative_humidity_2m_mean", "mean"),
+    "days": ("time", "count"),
+}
+
+# How each partial column is combined across chunks.
+_MERGE = {"max": "max", "min": "min", "sum": "sum", "count": "sum"}
+
+
+def _partial_spec(rules, columns):
+    spec = {}
+    for out, (col, how) in rules.items():
+        if col not in columns:
+            continue
+        if how == "mean":
+            spec[f"{out}__sum"] = (col, "sum")
+            spec[f"{out}__n"] = (col, "count")
+        else:
+            spec[out] = (col, how)
+    return spec
+
+
+def _merge(partials, keys, spec):
+    combined = pd.concat(partials, ignore_index=True)
+    return combined.groupby(keys, sort=False).agg(
+        **{col: (col, _MERGE[how]) for col, (_, how) in spec.items()}
+    ).reset_index()
+
+
+def stream_rollup(chunks, keys, rules, merge_every=8):
+    """Aggregate an iterable of frames by ``keys`` without concatenating them.
+
+    ``keys`` maps output key columns to functions that derive them from a
+    chunk.  Partial results are merged every ``merge_every`` chunks.
+    """
+    partials, spec = [], None
+    for chunk in chunks:
+        if spec is None:
+            spec = _partial_spec(rules, chunk.columns)
+        chunk = chunk.assign(**{name: derive(chunk) for name, derive in keys.items()})
+        partials.append(chunk.groupby(list(keys), sort=False).agg(**spec).reset_index())
+        if len(partials) >= merge_every:
+            partials = [_merge(partials, list(keys), spec)]
+    if not partials:
+        return pd.DataFrame(columns=list(keys) + list(rules))
+
+    merged = _merge(partials, list(keys), spec)
+    for out, (_, how) in rules.items():
+        if how == "mean" and f"{out}__sum" in merged:
+            merged[out] = merged.pop(f"{out}__sum") / merged.pop(f"{out}__n")
+    merged = merged[list(keys) + [c for c in rules if c in merged]]
+    return merged.sort_values(list(keys), ignore_index=True)
+
+
+def hourly_to_daily(hourly_csv, chunksize=250_000):
+    chunks = pd.read_csv(hourly_csv, chunksize=chunksize, parse_dates=["time"])
+    daily = stream_rollup(chunks, {
+        "city": lambda c: c["city"],
+        "day": lambda c: c["time"].dt.floor("D"),
+    }, DAILY_RULES)
+    daily = daily.rename(columns={"day": "time"})
+    columns = ["time"] + [c for c in DAILY_RULES if c in daily] + ["city"]
+    return daily[columns]
+
+
+def daily_to_monthly(daily_csv, chunksize=250_000):
+    """Monthly rollup keyed by ``city`` and the int ``engine.month_key``."""
+    chunks = pd.read_csv(daily_csv, chunksize=chunksize, parse_dates=["time"])
+    return stream_rollup(chunks, {
+        "city": lambda c: c["city"],
+        "YearMonth": lambda c: month_key(c["time"]),
+    }, MONTHLY_RULES)
+
+
+def build(hourly_csv=HOURLY_CSV, daily_csv=WEATHER_CSV, monthly_csv=MONTHLY_CSV, chunksize=250_000):
+    """Write the daily and monthly rollups of ``hourly_csv``.
+
+    Returns the number of daily rows and whether the daily file changed.
+    """
+    daily = hourly_to_daily(hourly_csv, chunksize)
+    changed = atomic_write(
+        daily_csv, lambda tmp: daily.to_csv(tmp, index=False, float_format="%.6g", date_format="%Y-%m-%d"),
+        skip_unchanged=True,
+    )
+    monthly = daily_to_monthly(daily_csv, chunksize)
+    atomic_write(monthly_csv, lambda tmp: monthly.to_csv(tmp, index=False, float_format="%.6g"),
+                 skip_unchanged=True)
+    return len(daily), changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Roll hourly weather up to daily and monthly files.")
+    parser.add_argument("hourly", nargs="?", default=HOURLY_CSV)
+    parser.add_argument("--daily", default=WEATHER_CSV)
+    parser.add_argument("--monthly", default=MONTHLY_CSV)
+    parser.add_argument("--chunksize", type=int, default=250_000)
+    args = parser.parse_args()
+    rows, _ = build(args.hourly, args.daily, args.monthly, args.chunksize)
+    print(f"✅ {rows} daily rows written to '{args.daily}', monthly rollup in '{args.monthly}'")
@@ -0,0 +1,58 @@
+"""Per-session memory accounting for the dashboard process.
+
+Each rerun reports the frames it materialized privately (filter results
+and tables sent to the browser).  Shared cached frames and
+slices of them are not counted, since they cost nothing per session.
+The totals live in this module, so they are shared by every session of
+the Streamlit process and can be shown in the debug panel.
+"""
+import os
+import threading
+import time
+
+import engine
+
+# Optional cap on one session's private bytes per rerun.
+SESSION_CAP_BYTES = int(float(os.environ.get("CLIMATE2CURE_SESSION_MB", "0")) * 2**20) or None
+
+# Sessions that have not rerun for this long are dropped from the totals.
+STALE_AFTER = 30 * 60
+
+_lock = threading.Lock()
+_sessions = {}
+
+
+class SessionUsage:
+    """Bytes materialized by one rerun of one session."""
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.frames = {}
+
+    def track(self, name, df):
+        """Count ``df`` under ``name`` and return it unchanged."""
+        self.frames[name] = engine.frame_bytes(df)
+        return df
+
+    @property
+    def total(self):
+        return sum(self.frames.values())
+
+    def fits(self, nbytes):
+        """Whether another ``nbytes`` stays under the session cap."""
+        return SESSION_CAP_BYTES is None or self.total + nbytes <= SESSION_CAP_BYTES
+
+    def publish(self):
+        now = time.time()
+        with _lock:
+            _sessions[self.session_id] = (now, self.total, dict(self.frames))
+            for session_id, (seen, _, _) in list(_sessions.items()):
+                if now - seen > STALE_AFTER:
+                    del _sessions[session_id]
+
+
+def snapshot():
+    """``[(session_id, bytes, frames)]`` for live sessions, largest first."""
+    with _lock:
+        rows = [(sid, total, frames) for sid, (_, total, frames) in _sessions.items()]
+    return sorted(rows, key=lambda row: row[1], reverse=True)
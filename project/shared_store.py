@@ -0,0 +1,86 @@
+"""Share loaded frames between dashboard processes via memory-mapped Arrow files.
+
+When several Streamlit replicas run on one host, set
+``CLIMATE2CURE_SHARED_DIR`` (``/dev/shm/climate2cure`` is a good choice) and
+the first process to need a frame writes it once as an uncompressed Arrow
+IPC file named after its dataset version.  Every process then memory-maps
+that file, so the column buffers live in the shared page cache instead of
+in each process's heap and resident memory stays flat as replicas are added.
+
+Requires ``pyarrow``; without it, or without the environment variable, the
+dashboard keeps private copies as before.
+"""
+import os
+
+from manifest import atomic_write
+
+SHARED_DIR = os.environ.get("CLIMATE2CURE_SHARED_DIR")
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+ENABLED = bool(SHARED_DIR) and pa is not None
+
+
+def frame_path(name, version):
+    return os.path.join(SHARED_DIR, f"{name}-{version}.arrow")
+
+
+def publish(name, version, df):
+    """Write ``df`` for ``(name, version)`` unless another process already did."""
+    path = frame_path(name, version)
+    if os.path.exists(path):
+        return path
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    def write(tmp):
+        with pa.OSFile(tmp, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+    atomic_write(path, write)
+    return path
+
+
+def attach(name, version):
+    """Map the published frame without copying its numeric buffers."""
+    source = pa.memory_map(frame_path(name, version), "r")
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True, self_destruct=False)
+
+
+def shared_frame(name, version, build):
+    """Attach to ``(name, version)``, building and publishing it first if needed."""
+    if not os.path.exists(frame_path(name, version)):
+        publish(name, version, build())
+    try:
+        return attach(name, version)
+    except FileNotFoundError:
+        # pruned by a replica on a newer version in the meantime
+        publish(name, version, build())
+        return attach(name, version)
+
+
+def prune(name, keep_version):
+    """Delete files of ``name`` older than the version before ``keep_version``.
+
+    The newest other file is kept too, since replicas that have not yet seen
+    the new manifest may still attach to it.  Processes that still map a
+    deleted file keep reading it until they drop their reference; the space
+    is reclaimed after that.
+    """
+    prefix, current = f"{name}-", os.path.basename(frame_path(name, keep_version))
+    older = []
+    for entry in os.scandir(SHARED_DIR):
+        if entry.name.startswith(prefix) and entry.name.endswith(".arrow") and entry.name != current:
+            try:
+                older.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                pass
+    for _, path in sorted(older)[:-1]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,23 @@
+import anomaly
+import engine
+
+
+def model():
+    return anomaly.AnomalyModel.fit(engine.load_disease())
+
+
+def test_alerts_before_the_data_are_empty():
+    fitted = model()
+    assert fitted.alerts("2018-01-01", "2019-06-30", threshold=-1e9).empty
+
+
+def test_alerts_after_the_data_are_empty():
+    fitted = model()
+    assert fitted.alerts("2030-01-01", "2031-12-31", threshold=-1e9).empty
+
+
+def test_alerts_stay_inside_the_range():
+    fitted = model()
+    flagged = fitted.alerts("2019-01-01", "2022-06-30", threshold=-1e9)
+    assert not flagged.empty
+    assert flagged["YearMonth"].between(fitted.first_month, anomaly.month_of("2022-06-01")).all()
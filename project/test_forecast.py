@@ -0,0 +1,24 @@
+import numpy as np
+
+import engine
+import forecast
+
+
+def test_last_year_is_nan_without_a_year_of_history():
+    cases = np.arange(16.0).reshape(2, 8)
+    for horizon in range(1, forecast.HORIZONS + 1):
+        assert np.isnan(forecast.last_year(cases, horizon)).all()
+
+
+def test_last_year_reads_the_same_month_a_year_earlier():
+    cases = np.arange(28.0).reshape(2, 14)
+    # month 14 (horizon 1) is a year after month 2
+    assert forecast.last_year(cases, 1).tolist() == [2.0, 16.0]
+    assert forecast.last_year(cases, 3).tolist() == [4.0, 18.0]
+
+
+def test_fit_on_a_short_history_forecasts_nothing():
+    weather, disease = engine.load_data()
+    short = disease[disease["YearMonth"] < disease["YearMonth"].min() + 8]
+    model = forecast.Forecaster.fit(short, engine.monthly_cube(weather))
+    assert np.isnan(model.forecasts).all()
@@ -1,59 +1,113 @@
-import requests
-import pandas as pd
+import argparse
 import time
+from datetime import date, timedelta
+
+import pandas as pd
+import requests
 
-cities= {
-    "Ahmedabad": (23.0225, 72.5714),
-    "Mumbai": (19.0760, 72.8777),
-    "Delhi": (28.7041, 77.1025),
-    "Chennai": (13.0827, 80.2707),
-    "Bengaluru": (12.9716, 77.5946),
-    "Hyderabad": (17.3850, 78.4867),
-    "Jaipur": (26.9124, 75.7873),
-    "Kolkata": (22.5726, 88.3639),
-    "Lucknow": (26.8467, 80.9462),
-    "Pune": (18.5204, 73.8567)
-}
+from engine import DISEASE_CSV, WEATHER_CSV
+from manifest import atomic_write, publish, read_manifest
+from meteo import ARCHIVE_LAG_DAYS, ARCHIVE_URL, CITIES, fetch_archive
+import rollup
 
 start_date = "2020-06-28"
 end_date = "2025-06-30"
 
-all_data = []
+parser = argparse.ArgumentParser(description="Download daily weather for every city from Open-Meteo.")
+parser.add_argument("--url", default=ARCHIVE_URL, help="archive endpoint (point at mock_meteo.py for offline runs)")
+parser.add_argument("--delay", type=float, default=10, help="seconds to wait between cities")
+parser.add_argument("--out", default=WEATHER_CSV, help="daily file the dashboard reads")
+parser.add_argument("--hourly", action="store_true",
+                    help="fetch hourly variables and build the daily/monthly files with rollup.py")
+parser.add_argument("--hourly-out", default=rollup.HOURLY_CSV)
+parser.add_argument("--start", default=start_date)
+parser.add_argument("--end", help=f"last day to fetch (default {end_date}, or the latest archived day with --daemon)")
+parser.add_argument("--daemon", action="store_true", help="keep running and refresh every --interval seconds")
+parser.add_argument("--interval", type=float, default=6 * 3600)
+args = parser.parse_args()
 
-for city, (lat, lon) in cities.items():
-    print(f"\n🌍 Fetching weather for {city}...")
-    
-    url = (
-        f"https://archive-api.open-meteo.com/v1/archive?"
-        f"latitude={lat}&longitude={lon}"
-        f"&start_date={start_date}&end_date={end_date}"
-        f"&daily=temperature_2m_max,temperature_2m_min,precipitation_sum,"
-        f"rain_sum,snowfall_sum,windspeed_10m_max,relative_humidity_2m_max,relative_humidity_2m_min"
-        f"&timezone=Asia%2FKolkata"
-    )
 
-    try:
-        response = requests.get(url)
-        data = response.json()
+def scrape(session, start, end, resolution):
+    """Yield one frame per city that was fetched successfully."""
+    for city, (lat, lon) in CITIES.items():
+        print(f"\n🌍 Fetching {resolution} weather for {city}...")
+
+        try:
+            df = fetch_archive(session, lat, lon, start, end, resolution, base_url=args.url)
+            df["city"] = city
+
+            print(f"✅ Success for {city}: {len(df)} rows")
+            yield df
+            time.sleep(args.delay)  # delay to prevent throttling
 
-        if "daily" not in data:
-            print(f"⚠️  No 'daily' data returned for {city}")
-            continue
+        except Exception as e:
+            print(f"❌ Error fetching data for {city}: {e}")
 
-        df = pd.DataFrame(data["daily"])
-        df["city"] = city
-        all_data.append(df)
 
-        print(f"✅ Success for {city}: {len(df)} rows")
-        time.sleep(10)  # delay to prevent throttling
+def fetch_daily_file(session, start, end):
+    all_data = list(scrape(session, start, end, "daily"))
 
-    except Exception as e:
-        print(f"❌ Error fetching data for {city}: {e}")
+    # Combine and save
+    if not all_data:
+        print("\n❌ No data collected.")
+        return None
+    if len(all_data) < len(CITIES) and args.daemon:
+        print("\n⚠️  Some cities failed; keeping the previous dataset.")
+        return None
 
-# Combine and save
-if all_data:
     final_df = pd.concat(all_data, ignore_index=True)
-    final_df.to_csv("weather_2020_2025.csv", index=False)
-    print("\n✅ All data saved to 'weather_2020_2025.csv'")
-else:
-    print("\n❌ No data collected.")
+    return atomic_write(args.out, lambda tmp: final_df.to_csv(tmp, index=False), skip_unchanged=True)
+
+
+def fetch_hourly_file(session, start, end):
+    # Hourly data is 24x the daily volume, so each city is appended to disk
+    # as soon as it arrives instead of being held until the end.
+    fetched = 0
+
+    def write(tmp):
+        nonlocal fetched
+        for df in scrape(session, start, end, "hourly"):
+            df.to_csv(tmp, mode="w" if fetched == 0 else "a", header=fetched == 0, index=False)
+            fetched += 1
+        if fetched == 0 or (fetched < len(CITIES) and args.daemon):
+            raise RuntimeError(f"only {fetched} of {len(CITIES)} cities fetched")
+
+    try:
+        atomic_write(args.hourly_out, write)
+    except RuntimeError as e:
+        print(f"\n❌ {e}; keeping the previous dataset.")
+        return None
+
+    rows, changed = rollup.build(args.hourly_out, args.out)
+    print(f"\n📦 Rolled {args.hourly_out} up to {rows} daily rows")
+    return changed
+
+
+def refresh(session):
+    end = args.end
+    if end is None:
+        end = (date.today() - timedelta(days=ARCHIVE_LAG_DAYS)).isoformat() if args.daemon else end_date
+
+    if args.hourly:
+        changed = fetch_hourly_file(session, args.start, end)
+    else:
+        changed = fetch_daily_file(session, args.start, end)
+    if changed is None:
+        return
+
+    if changed or not read_manifest():
+        manifest = publish([args.out, DISEASE_CSV])
+        print(f"\n✅ All data saved to '{args.out}' (dataset version {manifest['version']})")
+    else:
+        print(f"\n✅ '{args.out}' is already up to date")
+
+
+session = requests.Session()
+while True:
+    started = time.monotonic()
+    refresh(session)
+    if not args.daemon:
+        break
+    wait = max(0.0, args.interval - (time.monotonic() - started))
+    print(f"\n⏳ Next refresh in {wait / 60:.0f} minutes")
+    time.sleep(wait)